@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+
+"""
+Measures the validation of synthetic registration records: a new Form for
+every row compared to batch.validateMany and to the process pool of
+batch.ShardedValidator.
+
+Usage: python benchmarks/batch.py [rows] [processes]
+"""
+
+import os, sys, time, random
+
+sys.path.insert( 0, os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) ) )
+
+from liquid4m import form, batch
+import schemas, suite
+
+# generator<dict>
+def generateRows( number ):
+
+    rnd = random.Random( 0 )
+    for i in range( number ):
+        password = rnd.choice([ u'Secret123', u'secret', u'Pass1234' ])
+        yield {
+            'username': rnd.choice([ u'user%d' % i, u'admin', u'x' ]),
+            'password': password,
+            'password_again': rnd.choice([ password, u'Other123' ]),
+            'accept_tc': rnd.choice([ u'True', None ])
+        }
+
+# void
+def measure( name, fn, number ):
+
+    start = time.time()
+    invalid = sum( 1 for errors in fn() if errors )
+    elapsed = time.time() - start
+    print( '%-22s %8.2f s %10.0f rows/s (%d invalid)' % ( name, elapsed, number / elapsed, invalid ) )
+
+# void
+def main( number = 100000, processes = 4 ):
+
+    measure( 'Form per row', lambda: ( form.Form( schemas.Registration(), row ).isValid( True )[1] \
+        for row in generateRows( number ) ), number )
+
+    measure( 'validateMany', lambda: ( errors for _, _, errors in \
+        batch.validateMany( schemas.Registration(), generateRows( number ) ) ), number )
+
+    sharded = batch.ShardedValidator( batch.SchemaReference( schemas.Registration ), processes )
+    measure( 'ShardedValidator (%d)' % processes, lambda: ( errors for _, _, errors in \
+        sharded.validate( generateRows( number ) ) ), number )
+
+    for ( name, msg ), count in sharded.getStatistics().getErrors().most_common():
+        print( '%8d  %s: %s' % ( count, name, msg ) )
+
+@suite.benchmark( 'batch/validateMany' )
+def validateMany():
+
+    rows = list( generateRows( 1000 ) )
+    return lambda: list( batch.validateMany( schemas.Registration(), rows ) )
+
+if __name__ == '__main__':
+    main( *[ int( a ) for a in sys.argv[1:] ] )
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+
+"""
+Measures the cold start of a worker: the time of the first rendering of
+the contact_information demo form in a fresh interpreter, with the default
+template loader, with a bytecode cache and with precompiled templates.
+
+Usage: python benchmarks/cold_start.py [repeat]
+"""
+
+import os, sys, shutil, tempfile, subprocess
+
+ROOT = os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) )
+
+# Executed in a fresh interpreter for every measurement
+WORKER = """
+import sys, time
+sys.path[:0] = [ %(root)r, %(benchmarks)r ]
+from liquid4m import compiler, form
+import schemas
+mode, path = sys.argv[1], sys.argv[2]
+if mode == 'bytecode':
+    compiler.useBytecodeCache( path )
+elif mode == 'compiled':
+    compiler.useCompiledTemplates( path )
+start = time.time()
+form.Form( schemas.ContactInformation() ).render()
+sys.stdout.write( repr( time.time() - start ) )
+"""
+
+# float
+def measure( mode, path, repeat ):
+
+    code = WORKER % {
+        'root': ROOT,
+        'benchmarks': os.path.join( ROOT, 'benchmarks' )
+    }
+
+    return min([ float( subprocess.check_output([ sys.executable, '-c', code, mode, path ]) ) \
+        for _ in range( repeat ) ])
+
+# void
+def main( repeat = 5 ):
+
+    sys.path.insert( 0, ROOT )
+    from liquid4m import compiler
+
+    workdir = tempfile.mkdtemp()
+    try:
+        bytecode_dir = os.path.join( workdir, 'bytecode' )
+        compiled_dir = os.path.join( workdir, 'compiled' )
+        os.mkdir( bytecode_dir )
+        compiler.compileTemplates( compiled_dir )
+
+        # Warm up the bytecode cache
+        measure( 'bytecode', bytecode_dir, 1 )
+
+        for mode, path in [ ( 'default', '' ), ( 'bytecode', bytecode_dir ), \
+                            ( 'compiled', compiled_dir ) ]:
+            print( '%-10s %8.2f ms' % ( mode, measure( mode, path, repeat ) * 1000 ) )
+
+    finally:
+        shutil.rmtree( workdir )
+
+if __name__ == '__main__':
+    main( *[ int( a ) for a in sys.argv[1:] ] )
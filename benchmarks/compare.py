@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+"""
+Compare two results of the benchmark suite (eg. of two commits). The 
+minimum times are compared, the exit status is 1 if any benchmark is
+slower than the threshold.
+
+Usage: python benchmarks/compare.py base.json new.json [-t percent]
+"""
+
+import sys, json, argparse
+
+# dict
+def load( path ):
+
+    with open( path ) as f:
+        return json.load( f )
+
+# list<tuple>
+def compare( base, new, threshold ):
+
+    rows = []
+    for name in sorted( set( base['benchmarks'] ) | set( new['benchmarks'] ) ):
+        old_result = base['benchmarks'].get( name )
+        new_result = new['benchmarks'].get( name )
+        if old_result is None or new_result is None:
+            rows.append( ( name, old_result and old_result['min'], new_result and new_result['min'], None, 'missing' ) )
+            continue
+
+        change = ( new_result['min'] / old_result['min'] - 1 ) * 100
+        status = 'slower' \
+            if change > threshold \
+            else 'faster' \
+            if change < -threshold \
+            else ''
+
+        rows.append( ( name, old_result['min'], new_result['min'], change, status ) )
+
+    return rows
+
+# unicode
+def formatTime( seconds ):
+
+    return '-' \
+        if seconds is None \
+        else '{:.2f} us'.format( seconds * 1e6 )
+
+# int
+def main( args = None ):
+
+    parser = argparse.ArgumentParser( description = 'Compare two results of the benchmark suite.' )
+    parser.add_argument( 'base', help = 'Path of the base JSON result' )
+    parser.add_argument( 'new', help = 'Path of the new JSON result' )
+    parser.add_argument( '-t', '--threshold', type = float, default = 5.0, 
+        help = 'Tolerated change in percent' )
+    args = parser.parse_args( args )
+
+    base, new = load( args.base ), load( args.new )
+    sys.stdout.write( 'base: {commit} python {python}\n'.format( **base['metadata'] ) )
+    sys.stdout.write( 'new:  {commit} python {python}\n\n'.format( **new['metadata'] ) )
+
+    rows = compare( base, new, args.threshold )
+    for name, old_time, new_time, change, status in rows:
+        sys.stdout.write( '{:<40} {:>12} {:>12} {:>9} {}\n'.format(
+            name, 
+            formatTime( old_time ), 
+            formatTime( new_time ), 
+            '' if change is None else '{:+.1f}%'.format( change ),
+            status 
+        ) )
+
+    return 1 \
+        if any( status == 'slower' for _, _, _, _, status in rows ) \
+        else 0
+
+if __name__ == '__main__':
+    sys.exit( main() )
@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+
+"""
+Measures the Form( SchemaFieldSet() ) construction of the demo schemas.
+The cases are registered in the suite by forms.py (forms/construction/*),
+this script runs the ones of the registration and contact information
+schemas.
+
+Usage: python benchmarks/construction.py [number]
+"""
+
+import os, sys
+
+sys.path.insert( 0, os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) ) )
+
+import suite, forms
+
+NAMES = [ 'registration', 'contact_information' ]
+
+# void
+def main( number = 2000 ):
+
+    for name in NAMES:
+        result = suite.measure( 'forms/construction/{}'.format( name ), repeat = 3, number = number )
+        print( '%-20s %8.1f us' % ( name, result['min'] * 1e6 ) )
+
+if __name__ == '__main__':
+    main( *[ int( a ) for a in sys.argv[1:] ] )
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+
+"""
+Measures the column-wise conversion (Type.convertMany) compared to the
+conversion of the values one by one (Type.getValue).
+
+Usage: python benchmarks/conversion.py [number]
+"""
+
+import os, sys, time, random, datetime
+
+sys.path.insert( 0, os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) ) )
+
+from liquid4m.fields import types
+from liquid4m.exceptions import TypeConversionError
+import suite
+
+# dict<unicode,func>
+COLUMNS = {
+    'String': ( types.String, lambda rnd: rnd.choice([ u' John ', u'Jane', u'' ]) ),
+    'Integer': ( types.Integer, lambda rnd: unicode( rnd.randrange( 100000 ) ) ),
+    'Float': ( types.Float, lambda rnd: unicode( rnd.random() * 1000 ) ),
+    'Boolean': ( types.Boolean, lambda rnd: rnd.choice([ u'true', u'false', u'yes', u'0' ]) ),
+    'Date': ( types.Date, lambda rnd: unicode( datetime.date( 2000, 1, 1 ) + \
+        datetime.timedelta( days = rnd.randrange( 7300 ) ) ) ),
+    'DateTime': ( types.DateTime, lambda rnd: u'2014-05-06T%02d:%02d:00' % ( 
+        rnd.randrange( 24 ), rnd.randrange( 60 ) ) )
+}
+
+# list<type>
+def convertOneByOne( type_object, values ):
+
+    converted = []
+    for value in values:
+        try:
+            converted.append( type_object.getValue( value ) )
+
+        except TypeConversionError:
+            converted.append( None )
+
+    return converted
+
+# void
+def main( number = 200000 ):
+
+    rnd = random.Random( 0 )
+    for name, ( klass, generate ) in sorted( COLUMNS.items() ):
+        values = [ generate( rnd ) for _ in range( number ) ]
+
+        start = time.time()
+        convertOneByOne( klass(), values )
+        one_by_one = time.time() - start
+
+        start = time.time()
+        klass().convertMany( values )
+        column = time.time() - start
+
+        print( '%-10s getValue %8.0f values/s   convertMany %8.0f values/s' % ( 
+            name, number / one_by_one, number / column ) )
+
+# void
+def register( name, klass, generate ):
+
+    @suite.benchmark( 'conversion/convertMany/{}'.format( name ) )
+    def convertMany():
+
+        rnd = random.Random( 0 )
+        values = [ generate( rnd ) for _ in range( 10000 ) ]
+        return lambda: klass().convertMany( values )
+
+for name, ( klass, generate ) in COLUMNS.items():
+    register( name, klass, generate )
+
+if __name__ == '__main__':
+    main( *[ int( a ) for a in sys.argv[1:] ] )
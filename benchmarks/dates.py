@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+
+"""
+Measures the conversion of a column of ISO 8601 date strings by the Date
+type compared to parsing them with dateutil.
+
+Usage: python benchmarks/dates.py [number] [distinct]
+"""
+
+import os, sys, time, random, datetime
+from dateutil import parser
+
+sys.path.insert( 0, os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) ) )
+
+from liquid4m.fields import types
+import suite
+
+# list<unicode>
+def generateColumn( number, distinct ):
+
+    rnd = random.Random( 0 )
+    start = datetime.date( 2000, 1, 1 )
+    return [ unicode( start + datetime.timedelta( days = rnd.randrange( distinct ) ) ) \
+        for _ in range( number ) ]
+
+# void
+def measure( name, fn, column ):
+
+    start = time.time()
+    for value in column:
+        fn( value )
+
+    elapsed = time.time() - start
+    print( '%-22s %10.0f values/s' % ( name, len( column ) / elapsed ) )
+
+# void
+def main( number = 1000000, distinct = 365 * 20 ):
+
+    column = generateColumn( number, distinct )
+
+    # dateutil is slow, it is measured on a part of the column
+    measure( 'dateutil', lambda value: parser.parse( value ).date(), column[:number // 20] )
+    measure( 'Date.parseISO', types.Date().parseISO, column )
+    measure( 'Date.getValue', types.Date().getValue, column )
+
+@suite.benchmark( 'dates/getValue' )
+def dateColumn():
+
+    column = generateColumn( 10000, 365 * 20 )
+    date = types.Date()
+    return lambda: [ date.getValue( value ) for value in column ]
+
+if __name__ == '__main__':
+    main( *[ int( a ) for a in sys.argv[1:] ] )
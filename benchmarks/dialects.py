@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+
+"""
+Compares the copying (dict building) and the lazy (view) Flask dialect on a
+POST with 300 keys: the dialect alone and the dialect with the Form.
+
+Usage: python benchmarks/dialects.py [number]
+"""
+
+import os, sys, timeit
+
+sys.path.insert( 0, os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) ) )
+
+from werkzeug.datastructures import MultiDict
+from liquid4m import form, dialects
+from render import createSchema
+import suite
+
+# dict
+def copyingFlask( request_values ):
+
+    return { key : ( request_values[ key ] \
+        if len( request_values.getlist( key ) ) == 1 \
+        else request_values.getlist( key ) ) \
+        for key in request_values.keys() }
+
+# werkzeug.datastructures.MultiDict
+def createRequest( number_of_fields = 300 ):
+
+    items = []
+    for i in range( number_of_fields ):
+        name = 'field_%03d' % i
+        if i % 8 == 6:
+            items += [ ( name, u'1' ), ( name, u'3' ) ]
+
+        elif i % 8 == 2:
+            items.append( ( name, u'2014-01-%02d' % ( i % 28 + 1 ) ) )
+
+        else:
+            items.append( ( name, u'%d' % i ) )
+
+    return MultiDict( items )
+
+# void
+def main( number = 200 ):
+
+    schema = createSchema( 300 )()
+    values = createRequest( 300 )
+
+    assert form.Form( schema, copyingFlask( values ) ).getValue() == \
+        form.Form( schema, dialects.flask( values ) ).getValue()
+
+    for name, dialect in [ ( 'copying', copyingFlask ), ( 'view', dialects.flask ) ]:
+        elapsed = min( timeit.repeat( lambda: dialect( values ), number = number, repeat = 3 ) )
+        print( '%-10s dialect %8.3f ms' % ( name, elapsed / number * 1000 ) )
+
+        elapsed = min( timeit.repeat( lambda: form.Form( schema, dialect( values ) ), number = number, repeat = 3 ) )
+        print( '%-10s form    %8.3f ms' % ( name, elapsed / number * 1000 ) )
+
+@suite.benchmark( 'dialects/flask_300' )
+def flaskForm():
+
+    schema = createSchema( 300 )()
+    values = createRequest( 300 )
+    return lambda: form.Form( schema, dialects.flask( values ) )
+
+if __name__ == '__main__':
+    main( *[ int( a ) for a in sys.argv[1:] ] )
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+
+"""
+Compares the recursive flattening of the nested values with the iterative
+and the schema aware form.flattenAbsData on the contact information schema
+(with and without unknown keys in the payload).
+
+Usage: python benchmarks/flatten.py [number]
+"""
+
+import os, sys, timeit
+
+sys.path.insert( 0, os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) ) )
+
+from liquid4m import form
+from schemas import ContactInformation
+import suite
+
+# dict
+def recursiveFlatten( value_dict ):
+
+    r_dict = {}
+    for key, value in ( value_dict or {} ).items():
+        if not isinstance( value, dict ):
+            r_dict[ key ] = value
+            continue
+
+        for ikey, ivalue in recursiveFlatten( value ).items():
+            r_dict[ u'{}_{}'.format( key, ikey ) ] = ivalue
+
+    return r_dict
+
+# dict
+def createPayload( extra_keys = 0 ):
+
+    address = dict( country_code = u'HU', street = u'Main street 1', city = u'Budapest', postal_code = u'1111' )
+    payload = dict( delivery_address = dict( address ), invoice_address = dict( address ) )
+    payload[ 'metadata' ] = { 'key_%d' % i : { 'value' : i, 'nested' : { 'value' : i } } \
+        for i in range( extra_keys ) }
+
+    return payload
+
+# void
+def main( number = 2000 ):
+
+    element = form.Form( ContactInformation() ).getElement()
+    for extra_keys in ( 0, 100 ):
+        payload = createPayload( extra_keys )
+        for name, fn in [ 
+            ( 'recursive', lambda: recursiveFlatten( payload ) ),
+            ( 'iterative', lambda: form.flattenAbsData( payload ) ),
+            ( 'schema', lambda: form.flattenAbsData( payload, element ) ),
+        ]:
+            elapsed = min( timeit.repeat( fn, number = number, repeat = 3 ) )
+            print( '%-10s extra=%-4d %8.2f us' % ( name, extra_keys, elapsed / number * 1000000 ) )
+
+@suite.benchmark( 'flatten/iterative' )
+def flattenIterative():
+
+    payload = createPayload( 100 )
+    return lambda: form.flattenAbsData( payload )
+
+@suite.benchmark( 'flatten/schema' )
+def flattenSchema():
+
+    element = form.Form( ContactInformation() ).getElement()
+    payload = createPayload( 100 )
+    return lambda: form.flattenAbsData( payload, element )
+
+if __name__ == '__main__':
+    main( *[ int( a ) for a in sys.argv[1:] ] )
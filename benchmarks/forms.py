@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmarks of the Form life cycle (construction, setValue, isValid and 
+render) on the demo schemas.
+
+Usage: python benchmarks/run.py 'forms/*'
+"""
+
+from liquid4m import form
+import suite, schemas
+
+# void
+def register( name, schema, values ):
+
+    @suite.benchmark( 'forms/construction/{}'.format( name ) )
+    def construction():
+
+        return lambda: form.Form( schema() )
+
+    @suite.benchmark( 'forms/setValue/{}'.format( name ) )
+    def setValue():
+
+        f = form.Form( schema() )
+        return lambda: f.setValue( values )
+
+    @suite.benchmark( 'forms/isValid/{}'.format( name ) )
+    def isValid():
+
+        f = form.Form( schema(), values )
+        return f.isValid
+
+    @suite.benchmark( 'forms/render/{}'.format( name ) )
+    def render():
+
+        f = form.Form( schema(), values )
+        return f.render
+
+for name, ( schema, values ) in schemas.SCHEMAS.items():
+    register( name, schema, values )
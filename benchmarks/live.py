@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+
+"""
+Compares the per keystroke validation of the username field with a new
+registration form and with the live.LiveValidator (with and without the 
+cache of the results).
+
+Usage: python benchmarks/live.py [number] [distinct]
+"""
+
+import os, sys, timeit
+
+sys.path.insert( 0, os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) ) )
+
+from liquid4m import form, live
+from schemas import Registration
+import suite
+
+# unicode
+def validateForm( value ):
+
+    f = form.Form( Registration(), { 'username': value } )
+    f.isValid()
+    return f.username.getState().getError()
+
+# void
+def main( number = 2000, distinct = 50 ):
+
+    values = [ u'user%d' % ( i % distinct ) for i in range( number ) ]
+    cached = live.LiveValidator( Registration() )
+    uncached = live.LiveValidator( Registration(), cache_size = 1 )
+
+    for name, fn in [
+        ( 'form', validateForm ),
+        ( 'live', lambda value: uncached.validate( 'username', value ) ),
+        ( 'cached', lambda value: cached.validate( 'username', value ) ),
+    ]:
+        elapsed = min( timeit.repeat( lambda: [ fn( value ) for value in values ], number = 1, repeat = 3 ) )
+        print( '%-10s %8.2f us' % ( name, elapsed / number * 1000000 ) )
+
+@suite.benchmark( 'live/uncached' )
+def liveUncached():
+
+    validator = live.LiveValidator( Registration(), cache_size = 1 )
+    values = [ u'user%d' % i for i in range( 50 ) ]
+    return lambda: [ validator.validate( 'username', value ) for value in values ]
+
+@suite.benchmark( 'live/cached' )
+def liveCached():
+
+    validator = live.LiveValidator( Registration() )
+    values = [ u'user%d' % i for i in range( 50 ) ]
+    return lambda: [ validator.validate( 'username', value ) for value in values ]
+
+if __name__ == '__main__':
+    main( *[ int( a ) for a in sys.argv[1:] ] )
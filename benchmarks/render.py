@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+"""
+Compares the nested (one template per element) and the flat (one template
+with macros) rendering of a form with 200 fields.
+
+Usage: python benchmarks/render.py [number]
+"""
+
+import os, sys, timeit
+
+sys.path.insert( 0, os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) ) )
+
+from liquid4m import form, fields, fieldsets, widgets
+import suite
+
+# fieldsets.FieldSet
+def createSchema( number_of_fields = 200 ):
+
+    options = fields.options.generate([ ( i, 'Option %d' % i ) for i in range( 10 ) ])
+    factories = [
+        lambda: fields.Text( label = 'Text', required = True ),
+        lambda: fields.Number( label = 'Number' ),
+        lambda: fields.Date( label = 'Date' ),
+        lambda: fields.Email( label = 'Email' ),
+        lambda: fields.TextArea( label = 'TextArea' ),
+        lambda: fields.Select( label = 'Select', options = options, type = fields.types.Integer() ),
+        lambda: fields.Checkbox( label = 'Checkbox', options = options, type = fields.types.Integer() ),
+        lambda: fields.Radio( label = 'Radio', options = options, type = fields.types.Integer() ),
+    ]
+
+    attrs = {}
+    for i in range( number_of_fields ):
+        attrs[ 'field_%03d' % i ] = factories[ i % len( factories ) ]()
+
+    return type( 'LargeFieldSet', ( fieldsets.FieldSet, ), attrs )
+
+# void
+def main( number = 20 ):
+
+    schema = createSchema()
+    nested = form.Form( schema() )
+    flat = form.Form( schema(), widget = widgets.FlatForm() )
+
+    for name, f in [ ( 'nested', nested ), ( 'flat', flat ) ]:
+        elapsed = min( timeit.repeat( f.render, number = number, repeat = 3 ) )
+        print( '%-10s %8.2f ms' % ( name, elapsed / number * 1000 ) )
+
+@suite.benchmark( 'render/nested_200' )
+def renderNested():
+
+    return form.Form( createSchema()() ).render
+
+@suite.benchmark( 'render/flat_200' )
+def renderFlat():
+
+    return form.Form( createSchema()(), widget = widgets.FlatForm() ).render
+
+if __name__ == '__main__':
+    main( *[ int( a ) for a in sys.argv[1:] ] )
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+
+"""
+Run the benchmark suite and save the results in JSON.
+
+Usage: python benchmarks/run.py [-o results.json] [-r repeat] [-n number]
+       [-l] [--root checkout] [pattern ...]
+
+The --root option measures the library of an other checkout with the
+current benchmarks, eg. an earlier commit:
+
+    git worktree add /tmp/baseline <commit>
+    python benchmarks/run.py --root /tmp/baseline -o baseline.json
+    python benchmarks/run.py -o current.json
+    python benchmarks/compare.py baseline.json current.json
+"""
+
+import sys, json, fnmatch, argparse
+import suite
+
+# void
+def main( args = None ):
+
+    parser = argparse.ArgumentParser( description = 'Run the benchmark suite.' )
+    parser.add_argument( 'patterns', nargs = '*', help = 'Name patterns of the benchmarks (eg. render/*)' )
+    parser.add_argument( '-o', '--output', help = 'Path of the JSON result' )
+    parser.add_argument( '-r', '--repeat', type = int, default = 5, help = 'Number of measurements' )
+    parser.add_argument( '-n', '--number', type = int, help = 'Number of calls in one measurement' )
+    parser.add_argument( '-l', '--list', action = 'store_true', help = 'List the benchmarks' )
+    parser.add_argument( '--root', help = 'Root of the measured checkout (default is this one)' )
+    args = parser.parse_args( args )
+
+    if args.root:
+        suite.setRoot( args.root )
+
+    suite.discover()
+    names = [ name for name in sorted( suite.BENCHMARKS ) \
+        if not args.patterns or any( fnmatch.fnmatch( name, p ) for p in args.patterns ) ]
+
+    if args.list:
+        sys.stdout.write( '\n'.join( names ) + '\n' )
+        return
+
+    results = suite.run( names, args.repeat, args.number )
+    if args.output:
+        with open( args.output, 'w' ) as f:
+            json.dump( results, f, indent = 2, sort_keys = True )
+
+if __name__ == '__main__':
+    main()
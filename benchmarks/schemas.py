@@ -0,0 +1,281 @@
+# -*- coding: utf-8 -*-
+
+"""
+Schemas of the demo application used by the benchmarks. The features of
+the newer versions (cached option functions, remote autocomplete) are
+used only if they are available, so the same schemas could be measured
+on the earlier versions too (see run.py --root).
+"""
+
+import os, json, codecs, inspect, pycountry
+from liquid4m import fields, fieldsets, validators
+
+# Path of the Foursquare categories of the demo application
+FOURSQUARE = os.path.join( os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) ), 
+    'demo', 'static', '4sq.json' )
+
+# list<fields.options.Option>
+def getCountries():
+
+    return fields.options.generate( ( getattr( c, 'alpha_2', None ) or c.alpha2, c.name ) \
+        for c in pycountry.countries )
+
+# list<fields.options.Option>
+def getMusicGenres():
+
+    return fields.options.generate([ ( i + 1, name ) for i, name in enumerate([
+        'Avant-Garde', 'Blues', 'Children\'s', 'Classical', 'Comedy/Spoken',
+        'Country', 'Easy Listening', 'Electronic', 'Folk', 'Holiday',
+        'International', 'Jazz', 'Latin', 'New Age', 'Pop/Rock', 'R&B', 'Rap',
+        'Reggae', 'Religious', 'Stage & Screen', 'Vocal'
+    ]) ])
+
+# func
+def cached( fn ):
+
+    """
+    Caches the option function by fields.options.cached if it exists.
+    """
+
+    if not hasattr( fields.options, 'cached' ):
+        return fn
+
+    return fields.options.cached( ttl = 3600 )( fn )
+
+# dict
+def remote( url ):
+
+    """
+    Returns the parameters of the remote autocomplete mode if it exists.
+    """
+
+    if 'url' not in inspect.getargspec( fields.Autocomplete.__init__ ).args:
+        return {}
+
+    return { 'url': url }
+
+# list<fields.options.MultiDimensionalOption>
+@cached
+def getFoursquareCategories():
+
+    def getCategory( categories ):
+
+        for category in categories:
+            yield fields.options.MultiDimensionalOption(
+                category['id'],
+                category['name'],
+                options = getCategory( category.get('categories', []) )
+            )
+
+    with codecs.open( FOURSQUARE, 'r', 'utf-8' ) as f:
+        data = json.load( f )
+        return getCategory( data.get('response',{}).get('categories',[]) )
+
+# list<fields.options.Option>
+def getAgeGroups():
+
+    return [
+        fields.options.Option( '-9', 'Children, under 9 year' ),
+        fields.options.OptionGroup( 'Adolescents', options = [
+            fields.options.Option( '10-14', '10-14', disabled = True ),
+            fields.options.Option( '15-18', '15-18' ),
+        ] ),
+        fields.options.OptionGroup( 'Adults', options = [
+            fields.options.Option( '19-25', '19-25' ),
+            fields.options.Option( '26-35', '26-35' ),
+            fields.options.Option( '36-45', '36-45' ),
+        ] ),
+        fields.options.OptionGroup( 'Middle and Older age', disabled = True, options = [
+            fields.options.Option( '46-60', '46-60' ),
+            fields.options.Option( '60-', 'older then 60 year' ),
+        ] ),
+    ]
+
+class UserNotExists( fields.validators.Validator ):
+
+    msg = 'Please choose a different username.'
+
+    # bool
+    def isValid( self, f ):
+
+        return f.value != 'admin'
+
+class Registration( fieldsets.FieldSet ):
+
+    _default_validators = fieldsets.validators.Same(
+        position = 'password_again',
+        field_names = [ 'password', 'password_again' ]
+    )
+
+    username = fields.Text(
+        label = 'Username',
+        required = True,
+        validators = validators.And(
+            fields.validators.Length( 5, 18 ),
+            fields.validators.Pattern( '^[a-z0-9]+$' ),
+            UserNotExists()
+        )
+    )
+
+    password = fields.Password(
+        label = 'Password',
+        required = True,
+        validators = validators.And(
+            fields.validators.Length( 6, 32 ),
+            fields.validators.Pattern( '.*[a-z].*', ignorecase = False ),
+            fields.validators.Pattern( '.*[A-Z].*', ignorecase = False ),
+            fields.validators.Pattern( '.*[0-9].*' )
+        )
+    )
+
+    password_again = fields.Password(
+        label = 'Password again',
+        required = True,
+        validators = validators.And(
+            fields.validators.Length( 6, 32 ),
+            fields.validators.Pattern( '.*[a-z].*', ignorecase = False ),
+            fields.validators.Pattern( '.*[A-Z].*', ignorecase = False ),
+            fields.validators.Pattern( '.*[0-9].*' )
+        )
+    )
+
+    accept_tc = fields.SwitchCheckbox(
+        option = fields.options.Option( True, 'I Agree To The Terms & Conditions'),
+        validators = fields.validators.Equal(
+            True,
+            msg = 'You have to accept the Terms & Conditions.'
+        )
+    )
+
+class AddressFieldSet( fieldsets.FieldSet ):
+
+    _default_validators = validators.Or(
+        fieldsets.validators.NoneOf(),
+        fieldsets.validators.AllOf()
+    )
+
+    country_code = fields.Select(
+        label = 'Country Code',
+        options = [ fields.options.Empty() ] + getCountries()
+    )
+    street = fields.Text(
+        label = 'Street',
+        validators = fields.validators.Length( max_length = 255 )
+    )
+    city = fields.Text(
+        label = 'City',
+        validators = fields.validators.Length( max_length = 32 )
+    )
+    postal_code = fields.Number( label = 'Postal Code' )
+
+class ContactInformation( fieldsets.FieldSet ):
+
+    delivery_address = AddressFieldSet( legend = 'Delivery Address')
+    invoice_address = AddressFieldSet( legend = 'Invoice Address' )
+
+class SelectFields( fieldsets.FieldSet ):
+
+    active = fields.Select(
+        label = 'Active',
+        type = fields.types.Boolean(),
+        options = fields.options.generate([ ( True, 'Yes' ), ( False, 'No' ) ])
+    )
+    gender = fields.Select(
+        label = 'Gender',
+        options = [
+            fields.options.Empty(),
+            fields.options.Option( 'M', 'Male' ),
+            fields.options.Option( 'F', 'Female' )
+        ]
+    )
+    favourite_genre_ids = fields.Select(
+        label = 'Favourite Genres',
+        type = fields.types.Integer(),
+        multiple = True,
+        options = getMusicGenres
+    )
+    favourite_sub_genres = fields.Select(
+        label = 'Age group',
+        options = getAgeGroups()
+    )
+    interests_4sq_ids = fields.Select(
+        label = 'Interests in 4sq',
+        multiple = True,
+        options = getFoursquareCategories
+    )
+
+class AutocompleteField( fieldsets.FieldSet ):
+
+    country_code = fields.Autocomplete(
+        label = 'Country',
+        min_search_length = 2,
+        options = [ fields.options.Empty() ] + getCountries()
+    )
+    age_group = fields.Autocomplete(
+        label = 'Age group',
+        options = getAgeGroups()
+    )
+    visited_country_codes = fields.Autocomplete(
+        label = 'Visited Countries',
+        multiple = True,
+        min_search_length = 2,
+        validators = fields.validators.Selected( max_selected = 3 ),
+        options = getCountries()
+    )
+    country_of_residence_code = fields.Autocomplete(
+        label = 'Country of residence',
+        min_search_length = 2,
+        options = getCountries(),
+        **remote( '/autocomplete_field/search' )
+    )
+    tags = fields.Autocomplete(
+        label = 'Tags',
+        multiple = True,
+        extendable = True,
+        options = [ fields.options.Value( v ) for v in [ 'good', 'bad', 'great', 'horrible', 'terrible' ] ]
+    )
+    credit_card = fields.Autocomplete(
+        label = 'Credit Card',
+        extendable = True,
+        options = [ fields.options.Value( v ) for v in [ 'Mastercard', 'Visa', 
+            'American Express', 'Diners', 'HiperCard', 'GoodCard' ] ]
+    )
+
+# Demo schemas with submitted values, by name
+SCHEMAS = {
+    'registration': ( Registration, {
+        'username': u'johndoe',
+        'password': u'Secret123',
+        'password_again': u'Secret123',
+        'accept_tc': u'True'
+    } ),
+    'select_fields': ( SelectFields, {
+        'active': u'True',
+        'gender': u'F',
+        'favourite_genre_ids': [ u'2', u'12', u'15' ],
+        'favourite_sub_genres': u'26-35',
+        'interests_4sq_ids': [ u'4d4b7104d754a06370d81259', u'4bf58dd8d48988d198941735' ]
+    } ),
+    'contact_information': ( ContactInformation, {
+        'delivery_address': {
+            'country_code': u'HU',
+            'street': u'Andrassy ut 1.',
+            'city': u'Budapest',
+            'postal_code': u'1061'
+        },
+        'invoice_address': {
+            'country_code': u'AT',
+            'street': u'Stephansplatz 1',
+            'city': u'Wien',
+            'postal_code': u'1010'
+        }
+    } ),
+    'autocomplete_field': ( AutocompleteField, {
+        'country_code': u'HU',
+        'age_group': u'19-25',
+        'visited_country_codes': [ u'AT', u'DE' ],
+        'country_of_residence_code': u'HU',
+        'tags': [ u'good', u'sunny' ],
+        'credit_card': u'Visa'
+    } )
+}
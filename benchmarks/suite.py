@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+
+"""
+Registry and runner of the benchmark suite. Any module of the benchmarks
+directory can register benchmarks with the benchmark decorator: the
+decorated function prepares the measured objects and returns the timed
+function (without arguments).
+
+    @suite.benchmark( 'render/registration' )
+    def renderRegistration():
+
+        f = form.Form( schemas.Registration() )
+        return f.render
+
+See run.py to run the suite and compare.py to compare two results. The
+suite could measure an other checkout of the library (eg. an earlier
+commit) with setRoot.
+"""
+
+import os, sys, time, timeit, platform, datetime, importlib, subprocess, traceback
+
+DIRECTORY = os.path.dirname( os.path.abspath( __file__ ) )
+ROOT = os.path.dirname( DIRECTORY )
+sys.path[:0] = [ ROOT, DIRECTORY ]
+
+# Modules which are not containing benchmarks
+IGNORED = { 'suite', 'run', 'compare', 'schemas' }
+
+# Registered benchmarks by name
+BENCHMARKS = {}
+
+# func
+def benchmark( name, number = None ):
+
+    """
+    Register the decorated setup function as a benchmark.
+
+    @param name: Unique name of the benchmark (eg. group/case)
+    @type name: unicode
+
+    @param number: Number of calls in one measurement (None means it is
+        calibrated automatically)
+    @type number: int
+
+    @return: Decorator
+    @rtype: func
+    """
+
+    # func
+    def decorator( setup ):
+
+        if name in BENCHMARKS:
+            raise ValueError( 'Benchmark is already registered: {}'.format( name ) )
+
+        BENCHMARKS[ name ] = ( setup, number )
+        return setup
+
+    return decorator
+
+# void
+def setRoot( root ):
+
+    """
+    Measure the library of the given checkout. It has to be called before
+    discover, the library is imported from the root at once, so the
+    benchmark modules can not import an other one.
+
+    @param root: Root directory of the checkout (which contains liquid4m)
+    @type root: unicode
+    """
+
+    global ROOT
+
+    if 'liquid4m' in sys.modules:
+        raise RuntimeError( 'liquid4m is already imported from {}'.format(
+            os.path.dirname( sys.modules['liquid4m'].__file__ ) ) )
+
+    ROOT = os.path.abspath( root )
+    sys.path.insert( 0, ROOT )
+    importlib.import_module( 'liquid4m' )
+
+# list<unicode>
+def discover( directory = None ):
+
+    """
+    Import every module of the benchmarks directory, so their benchmarks
+    are registered. The modules which could not be imported (eg. missing
+    optional dependency) are skipped with a warning.
+
+    @param directory: Directory of the modules
+    @type directory: unicode
+
+    @return: Names of the skipped modules
+    @rtype: list<unicode>
+    """
+
+    directory = directory or DIRECTORY
+    skipped = []
+    for filename in sorted( os.listdir( directory ) ):
+        module, extension = os.path.splitext( filename )
+        if extension != '.py' or module in IGNORED:
+            continue
+
+        try:
+            importlib.import_module( module )
+
+        except ImportError as e:
+            sys.stderr.write( 'Skipped {}: {}\n'.format( module, e ) )
+            skipped.append( module )
+
+    return skipped
+
+# int
+def calibrate( fn, min_time = 0.2 ):
+
+    """
+    Returns the number of calls which takes at least min_time seconds.
+
+    @param fn: Timed function
+    @type fn: func
+
+    @param min_time: Minimum time of a measurement in seconds
+    @type min_time: float
+
+    @return: Number of calls
+    @rtype: int
+    """
+
+    number = 1
+    while True:
+        for multiplier in ( 1, 2, 5 ):
+            if timeit.timeit( fn, number = number * multiplier ) >= min_time:
+                return number * multiplier
+
+        number *= 10
+
+# dict
+def measure( name, repeat = 5, number = None ):
+
+    """
+    Measure the registered benchmark.
+
+    @param name: Name of the benchmark
+    @type name: unicode
+
+    @param repeat: Number of measurements
+    @type repeat: int
+
+    @param number: Number of calls in one measurement (overrides the
+        registered one)
+    @type number: int
+
+    @return: Number of calls and the minimum, median and mean time of a
+        call in seconds
+    @rtype: dict
+    """
+
+    setup, registered_number = BENCHMARKS[ name ]
+    fn = setup()
+
+    # Warm up (eg. template loading, caches)
+    fn()
+
+    number = number or registered_number or calibrate( fn )
+    timings = sorted( t / number for t in timeit.repeat( fn, number = number, repeat = repeat ) )
+
+    return {
+        'number': number,
+        'repeat': repeat,
+        'min': timings[0],
+        'median': timings[ len( timings ) // 2 ],
+        'mean': sum( timings ) / len( timings )
+    }
+
+# dict
+def getMetadata():
+
+    """
+    Returns the description of the environment of the measurement.
+
+    @return: Python version, platform, date and git commit of the
+        measured library
+    @rtype: dict
+    """
+
+    try:
+        commit = subprocess.check_output(
+            [ 'git', 'rev-parse', '--short', 'HEAD' ],
+            cwd = ROOT,
+            stderr = open( os.devnull, 'w' )
+        ).decode( 'ascii' ).strip()
+
+    except ( OSError, subprocess.CalledProcessError ):
+        commit = None
+
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'date': datetime.datetime.utcnow().isoformat(),
+        'commit': commit
+    }
+
+# dict
+def run( names = None, repeat = 5, number = None, output = sys.stdout ):
+
+    """
+    Run the benchmarks and print the results one by one. If a benchmark
+    fails its traceback is printed and it is missing from the results.
+
+    @param names: Names of the benchmarks (None means every benchmark)
+    @type names: list<unicode>
+
+    @param repeat: Number of measurements
+    @type repeat: int
+
+    @param number: Number of calls in one measurement
+    @type number: int
+
+    @param output: Stream of the progress
+    @type output: file
+
+    @return: Metadata and the results by name
+    @rtype: dict
+    """
+
+    results = {}
+    for name in sorted( BENCHMARKS ) if names is None else names:
+        start = time.time()
+        try:
+            results[ name ] = result = measure( name, repeat, number )
+
+        except Exception:
+            traceback.print_exc()
+            continue
+
+        output.write( '{:<40} {:>12.2f} us  (x{}, {:.1f} s)\n'.format(
+            name, result['min'] * 1e6, result['number'], time.time() - start ) )
+
+    return {
+        'metadata': getMetadata(),
+        'benchmarks': results
+    }
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+
+"""
+Measures the Form.isValid() throughput of the demo registration form with
+valid and invalid submitted data.
+
+Usage: python benchmarks/validation.py [number]
+"""
+
+import os, sys, timeit
+
+sys.path.insert( 0, os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) ) )
+
+from liquid4m import form
+import suite, schemas
+
+DATA = {
+    'valid': {
+        'username': u'johndoe',
+        'password': u'Secret123',
+        'password_again': u'Secret123',
+        'accept_tc': u'True'
+    },
+    'invalid': {
+        'username': u'admin',
+        'password': u'secret',
+        'password_again': u'Secret123',
+        'accept_tc': None
+    }
+}
+
+# void
+def main( number = 5000 ):
+
+    for name, data in sorted( DATA.items() ):
+        f = form.Form( schemas.Registration(), data )
+        elapsed = min( timeit.repeat( f.isValid, number = number, repeat = 3 ) )
+        print( '%-10s %10.0f forms/s %8.1f us' % ( name, number / elapsed, elapsed / number * 1e6 ) )
+
+# void
+def register( name, data ):
+
+    @suite.benchmark( 'validation/registration_{}'.format( name ) )
+    def validation():
+
+        return form.Form( schemas.Registration(), data ).isValid
+
+for name, data in DATA.items():
+    register( name, data )
+
+if __name__ == '__main__':
+    main( *[ int( a ) for a in sys.argv[1:] ] )
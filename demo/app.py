@@ -47,6 +47,30 @@ class demo( object ):
 
         return decorated
 
+# list<fields.options.MultiDimensionalOption>
+# Hint: Cache the expensive option functions, it will be called
+# once per hour instead of every access. Define them on module level,
+# so the cache is shared by the requests.
+@fields.options.cached( ttl = 3600 )
+def getFoursquareCategories():
+
+    def getCategory( categories ):
+
+        for category in categories:
+            # Hint: Use MultiDimensionalOption for multiple level
+            # option lists.
+            yield fields.options.MultiDimensionalOption(
+                category['id'],
+                category['name'],
+                options = getCategory( category.get('categories', []) )
+            )
+
+    with codecs.open( os.path.join( APP_STATIC, '4sq.json'), 'r', 'utf-8' ) as f:
+        data = json.load( f )
+        return getCategory( data.get('response',{}).get('categories',[]) )
+
+    return []
+
 @app.route( '/' )
 def index():
 
@@ -356,26 +380,6 @@ def select_fields():
                 ( 21, 'Vocal' ),
             ])
 
-        # list<fields.options.MultiDimensionalOption>
-        def getFoursquareCategories():
-
-            def getCategory( categories ):
-
-                for category in categories:
-                    # Hint: Use MultiDimensionalOption for multiple level
-                    # option lists.
-                    yield fields.options.MultiDimensionalOption(
-                        category['id'],
-                        category['name'],
-                        options = getCategory( category.get('categories', []) )
-                    )
-
-            with codecs.open( os.path.join( APP_STATIC, '4sq.json'), 'r', 'utf-8' ) as f:
-                data = json.load( f )
-                return getCategory( data.get('response',{}).get('categories',[]) )
-
-            return []
-
         active = fields.Select(
             label = 'Active',
             type = fields.types.Boolean(),
@@ -441,6 +445,7 @@ def select_fields():
         interests_4sq_ids = fields.Select(
             label = 'Interests in 4sq',
             multiple = True,
+            # Hint: cached option function of the module (see above)
             options = getFoursquareCategories
         )
 
@@ -865,6 +870,20 @@ def allof_validator():
     # Use f.render to return the renderer function
     return f
 
+# Hint: The search route has its own field, the forms never share it.
+country_search = fields.Autocomplete(
+    options = fields.options.generate( ( c.alpha2, c.name ) \
+        for c in pycountry.countries )
+)
+
+@app.route( '/autocomplete_field/search' )
+def autocomplete_search():
+
+    return Response(
+        country_search.searchJSON( request.args.get('q'), request.args.get('page') ),
+        mimetype = 'application/json'
+    )
+
 @app.route( '/autocomplete_field', methods = ['GET','POST'] )
 @demo('Autocomplete Field')
 def autocomplete_field():
@@ -922,6 +941,16 @@ def autocomplete_field():
                 for c in pycountry.countries )
         )
 
+        # Hint: Remote Autocomplete field, see the autocomplete_search function.
+        country_of_residence_code = fields.Autocomplete(
+            label = 'Country of residence',
+            min_search_length = 2,
+            # Hint: Options are searched on the server, they are not embedded into the page.
+            url = '/autocomplete_field/search',
+            options = fields.options.generate( ( c.alpha2, c.name ) \
+                for c in pycountry.countries )
+        )
+
         tags = fields.Autocomplete(
             label = 'Tags',
             multiple = True,
@@ -20,12 +20,16 @@ along with this program. If not, <see http://www.gnu.org/licenses/>.
 """
 
 from . import (
+    batch, 
+    cache, 
+    compiler, 
     dialects, 
     elements, 
     exceptions, 
     fields, 
     fieldsets, 
     form, 
+    live, 
     state, 
     validators, 
     widgets
@@ -0,0 +1,391 @@
+# -*- coding: utf-8 -*-
+
+"""
+Liquid is a form management tool for web frameworks.
+Copyright (C) 2014, Bence Faludi (b.faludi@mito.hu)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, <see http://www.gnu.org/licenses/>.
+"""
+
+import multiprocessing, importlib
+from collections import deque, Counter
+from itertools import islice
+from . import form, elements, exceptions
+
+# Validator of the worker process (set by the pool's initializer)
+_worker = None
+
+# generator<tuple<int,dict,list>>
+def validateMany( schema, rows, chunk_size = 1000, processes = None ):
+
+    """
+    Validate many records (eg. rows of a CSV or JSON import) against the
+    schema. The schema is cloned only once, the same form is reused for
+    every row. The errors are the same as the Form.isValid( True ) ones.
+
+    @param schema: Schema element object or reference
+    @type schema: elements.Element | batch.SchemaReference
+
+    @param rows: Iterable of value dictionaries
+    @type rows: iterable<dict>
+
+    @param chunk_size: Number of rows processed together
+    @type chunk_size: int
+
+    @param processes: Number of worker processes (None means the rows are
+        validated in the current process)
+    @type processes: int
+
+    @return: Index, converted value and the list of errors of every row
+    @rtype: generator<tuple<int,dict,list<tuple<unicode,unicode>>>>
+    """
+
+    if processes is None:
+        validator = BatchValidator( schema )
+        for chunk in iterChunks( rows, chunk_size ):
+            for result in validator.validateChunk( chunk ):
+                yield result
+
+        return
+
+    for result in ShardedValidator( schema, processes, chunk_size ).validate( rows ):
+        yield result
+
+# generator<list<tuple<int,dict>>>
+def iterChunks( rows, chunk_size ):
+
+    """
+    Split the rows into numbered chunks.
+
+    @param rows: Iterable of value dictionaries
+    @type rows: iterable<dict>
+
+    @param chunk_size: Number of rows in a chunk
+    @type chunk_size: int
+
+    @return: Chunks of the indexed rows
+    @rtype: generator<list<tuple<int,dict>>>
+    """
+
+    indexed_rows = enumerate( rows )
+    while True:
+        chunk = list( islice( indexed_rows, chunk_size ) )
+        if not chunk:
+            return
+
+        yield chunk
+
+# void
+def _initWorker( schema ):
+
+    global _worker
+    _worker = BatchValidator( schema )
+
+# list<tuple<int,dict,list>>
+def _validateChunk( chunk ):
+
+    return _worker.validateChunk( chunk )
+
+class BatchValidator( object ):
+
+    """
+    Validate records one after the other with the same form. The states
+    of the elements are restored before every record, so the records do
+    not affect each other.
+    """
+
+    # Error message of the not convertible values
+    conversion_msg = u'Please enter a valid value.'
+
+    # void
+    def __init__( self, schema ):
+
+        """
+        Validate records one after the other with the same form.
+
+        @param schema: Schema element object or reference
+        @type schema: elements.Element | batch.SchemaReference
+        """
+
+        if isinstance( schema, SchemaReference ):
+            schema = schema.getSchema()
+
+        self._form = form.Form( schema )
+        self._fields = []
+        self._snapshots = []
+
+        stack = [ self._form.getElement() ]
+        while stack:
+            element = stack.pop()
+            self._snapshots.append( ( element.getState(), element.getState().getSnapshot() ) )
+
+            if isinstance( element, elements.ElementCollector ):
+                stack.extend( reversed( element.getElements() ) )
+
+            else:
+                self._fields.append( element )
+
+    # form.Form
+    def getForm( self ):
+
+        """
+        Returns the reused form.
+
+        @return: Form object
+        @rtype: form.Form
+        """
+
+        return self._form
+
+    # tuple<dict,list>
+    def validate( self, row ):
+
+        """
+        Validate the record. If a value is not convertible to the field's
+        type the record is not validated.
+
+        @param row: Record's values
+        @type row: dict
+
+        @return: Converted value and the list of errors
+        @rtype: tuple<dict,list<tuple<unicode,unicode>>>
+        """
+
+        for state, snapshot in self._snapshots:
+            state.restoreSnapshot( snapshot )
+
+        values = form.flattenAbsData( row, self._form.getElement() )
+        errors = []
+        for field in self._fields:
+            try:
+                field.setValue( values.get( field.getAbsName() ) )
+
+            except exceptions.TypeConversionError:
+                field.setValue( None )
+                errors.append( ( field.getName(), self.conversion_msg ) )
+
+        if not errors:
+            _, errors = self._form.isValid( True )
+
+        return self._form.getValue(), errors
+
+    # list<tuple<int,dict,list>>
+    def validateChunk( self, chunk ):
+
+        """
+        Validate a chunk of numbered records.
+
+        @param chunk: List of index and values
+        @type chunk: list<tuple<int,dict>>
+
+        @return: Index, converted value and the list of errors of every row
+        @rtype: list<tuple<int,dict,list<tuple<unicode,unicode>>>>
+        """
+
+        return [ ( index, ) + self.validate( row ) for index, row in chunk ]
+
+class SchemaReference( object ):
+
+    """
+    Picklable description of a schema: the importable FieldSet class and
+    its keyword arguments. The worker processes create the schema from it,
+    so the schema objects are not sent to them.
+    """
+
+    # void
+    def __init__( self, klass, **kwargs ):
+
+        """
+        Picklable description of a schema.
+
+        @param klass: Schema class (it must be defined on module level)
+        @type klass: type
+
+        @param kwargs: Keyword arguments of the schema class
+        @type kwargs: dict
+        """
+
+        self.module = klass.__module__
+        self.name = klass.__name__
+        self.kwargs = kwargs
+
+    # elements.Element
+    def getSchema( self ):
+
+        """
+        Import the class and create the schema element.
+
+        @return: Schema element object
+        @rtype: elements.Element
+        """
+
+        klass = getattr( importlib.import_module( self.module ), self.name )
+        return klass( **self.kwargs )
+
+class Statistics( object ):
+
+    """
+    Statistics of the validated records.
+    """
+
+    # void
+    def __init__( self ):
+
+        """
+        Statistics of the validated records.
+        """
+
+        self._rows = 0
+        self._invalid_rows = 0
+        self._errors = Counter()
+
+    # void
+    def add( self, errors ):
+
+        """
+        Add the result of a record.
+
+        @param errors: List of the record's errors
+        @type errors: list<tuple<unicode,unicode>>
+        """
+
+        self._rows += 1
+        if errors:
+            self._invalid_rows += 1
+            self._errors.update( errors )
+
+    # int
+    def getRows( self ):
+
+        """
+        Returns the number of the validated records.
+
+        @return: Number of records
+        @rtype: int
+        """
+
+        return self._rows
+
+    # int
+    def getInvalidRows( self ):
+
+        """
+        Returns the number of the invalid records.
+
+        @return: Number of invalid records
+        @rtype: int
+        """
+
+        return self._invalid_rows
+
+    # collections.Counter
+    def getErrors( self ):
+
+        """
+        Returns the number of occurrences of the errors.
+
+        @return: Number of the errors by name and message
+        @rtype: collections.Counter
+        """
+
+        return self._errors
+
+class ShardedValidator( object ):
+
+    """
+    Validate records on a process pool. The rows are sent to the workers in
+    chunks and the results are returned in the original order. Only a
+    limited number of chunks are in progress, so the rows are read only as
+    fast as the workers can validate them and the memory usage is bounded.
+    """
+
+    # void
+    def __init__( self, schema, processes = None, chunk_size = 1000, max_pending = None ):
+
+        """
+        Validate records on a process pool.
+
+        @param schema: Schema reference (or a schema element object, it 
+            works only with forked worker processes)
+        @type schema: batch.SchemaReference
+
+        @param processes: Number of worker processes (default is the number
+            of CPUs)
+        @type processes: int
+
+        @param chunk_size: Number of rows in a chunk
+        @type chunk_size: int
+
+        @param max_pending: Maximum number of chunks in progress (default is
+            the double of the processes)
+        @type max_pending: int
+        """
+
+        self._schema = schema
+        self._processes = processes or multiprocessing.cpu_count()
+        self._chunk_size = chunk_size
+        self._max_pending = max_pending or 2 * self._processes
+        self._statistics = Statistics()
+
+    # batch.Statistics
+    def getStatistics( self ):
+
+        """
+        Returns the statistics of the validated records.
+
+        @return: Statistics object
+        @rtype: batch.Statistics
+        """
+
+        return self._statistics
+
+    # generator<tuple<int,dict,list>>
+    def validate( self, rows ):
+
+        """
+        Validate the records on the process pool.
+
+        @param rows: Iterable of value dictionaries
+        @type rows: iterable<dict>
+
+        @return: Index, converted value and the list of errors of every row
+        @rtype: generator<tuple<int,dict,list<tuple<unicode,unicode>>>>
+        """
+
+        pool = multiprocessing.Pool( self._processes, _initWorker, ( self._schema, ) )
+        pending = deque()
+
+        try:
+            for chunk in iterChunks( rows, self._chunk_size ):
+                pending.append( pool.apply_async( _validateChunk, ( chunk, ) ) )
+                if len( pending ) >= self._max_pending:
+                    for result in self._collect( pending.popleft() ):
+                        yield result
+
+            while pending:
+                for result in self._collect( pending.popleft() ):
+                    yield result
+
+        finally:
+            pool.terminate()
+            pool.join()
+
+    # list<tuple<int,dict,list>>
+    def _collect( self, pending_chunk ):
+
+        results = pending_chunk.get()
+        for index, value, errors in results:
+            self._statistics.add( errors )
+
+        return results
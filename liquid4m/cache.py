@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+
+"""
+Liquid is a form management tool for web frameworks.
+Copyright (C) 2014, Bence Faludi (b.faludi@mito.hu)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, <see http://www.gnu.org/licenses/>.
+"""
+
+import time, threading
+from collections import OrderedDict
+
+class LRUCache( object ):
+
+    """
+    Thread-safe key-value cache with least recently used eviction and
+    optional expiration time.
+    """
+
+    # void
+    def __init__( self, max_size = None, ttl = None ):
+
+        """
+        Thread-safe key-value cache with least recently used eviction and
+        optional expiration time.
+
+        @param max_size: Maximum number of items (None means unlimited)
+        @type max_size: int
+
+        @param ttl: Lifetime of the items in seconds (None means forever)
+        @type ttl: float
+        """
+
+        self._max_size = max_size
+        self._ttl = ttl
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    # int
+    def __len__( self ):
+
+        """
+        Returns the number of the stored items.
+
+        @return: Number of items
+        @rtype: int
+        """
+
+        return len( self._items )
+
+    # type
+    def get( self, key, default = None ):
+
+        """
+        Returns the item of the given key. If the key is not found or the
+        item is expired it returns the default value.
+
+        @param key: Key of the item
+        @type key: type
+
+        @param default: Returned value if the item is not found
+        @type default: type
+
+        @return: Stored value
+        @rtype: type
+        """
+
+        with self._lock:
+            try:
+                expires, value = self._items.pop( key )
+
+            except KeyError:
+                self._misses += 1
+                return default
+
+            if expires is not None and expires < time.time():
+                self._misses += 1
+                return default
+
+            # Move the item to the end of the list
+            self._items[ key ] = ( expires, value )
+            self._hits += 1
+            return value
+
+    # void
+    def set( self, key, value ):
+
+        """
+        Store an item. If the cache is full it drops the least recently
+        used item.
+
+        @param key: Key of the item
+        @type key: type
+
+        @param value: Stored value
+        @type value: type
+        """
+
+        expires = time.time() + self._ttl \
+            if self._ttl is not None \
+            else None
+
+        with self._lock:
+            self._items.pop( key, None )
+            self._items[ key ] = ( expires, value )
+
+            while self._max_size is not None and len( self._items ) > self._max_size:
+                self._items.popitem( last = False )
+
+    # void
+    def invalidate( self, key = None ):
+
+        """
+        Drop the item of the given key, or every item if the key is
+        not defined.
+
+        @param key: Key of the item
+        @type key: type
+        """
+
+        with self._lock:
+            if key is None:
+                self._items.clear()
+
+            else:
+                self._items.pop( key, None )
+
+    # int
+    def getHits( self ):
+
+        """
+        Returns the number of successful lookups.
+
+        @return: Number of hits
+        @rtype: int
+        """
+
+        return self._hits
+
+    # int
+    def getMisses( self ):
+
+        """
+        Returns the number of failed lookups.
+
+        @return: Number of misses
+        @rtype: int
+        """
+
+        return self._misses
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+
+"""
+Liquid is a form management tool for web frameworks.
+Copyright (C) 2014, Bence Faludi (b.faludi@mito.hu)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, <see http://www.gnu.org/licenses/>.
+"""
+
+import argparse
+from jinja2 import Environment, PackageLoader, ModuleLoader, FileSystemBytecodeCache
+from . import widgets
+
+# void
+def compileTemplates( target, zip = None, package_name = 'liquid4m', \
+                      package_path = 'templates' ):
+
+    """
+    Precompile every template of the given template package into python
+    modules. The result could be loaded by useCompiledTemplates() so the
+    workers won't parse any template during the start.
+
+    @param target: Target directory (or zip file if zip is defined)
+    @type target: unicode
+
+    @param zip: Compression of the zip file ('deflated', 'stored' or None)
+    @type zip: unicode
+
+    @param package_name: Name of the package which contains the templates
+    @type package_name: unicode
+
+    @param package_path: Templates directory inside the package
+    @type package_path: unicode
+    """
+
+    environment = Environment(
+        loader = PackageLoader( package_name, package_path )
+    )
+    environment.compile_templates( target, zip = zip, ignore_errors = False )
+
+# void
+def useCompiledTemplates( path, package_name = 'liquid4m', \
+                          package_path = 'templates' ):
+
+    """
+    Set the shared Environment of the template package to load the
+    templates from the precompiled modules created by compileTemplates().
+
+    @param path: Directory (or zip file) of the precompiled templates
+    @type path: unicode
+
+    @param package_name: Name of the package which contains the templates
+    @type package_name: unicode
+
+    @param package_path: Templates directory inside the package
+    @type package_path: unicode
+    """
+
+    widgets.setEnvironment(
+        Environment( loader = ModuleLoader( path ) ),
+        package_name,
+        package_path
+    )
+
+# void
+def useBytecodeCache( directory, package_name = 'liquid4m', \
+                      package_path = 'templates' ):
+
+    """
+    Set the shared Environment of the template package to store the
+    compiled templates in a bytecode cache directory. Only the first
+    process has to compile the templates, the others will load them from
+    the cache.
+
+    @param directory: Bytecode cache directory
+    @type directory: unicode
+
+    @param package_name: Name of the package which contains the templates
+    @type package_name: unicode
+
+    @param package_path: Templates directory inside the package
+    @type package_path: unicode
+    """
+
+    widgets.setEnvironment(
+        Environment(
+            loader = PackageLoader( package_name, package_path ),
+            bytecode_cache = FileSystemBytecodeCache( directory )
+        ),
+        package_name,
+        package_path
+    )
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(
+        description = 'Precompile the templates of Liquid.'
+    )
+    parser.add_argument( 'target',
+        help = 'Target directory (or zip file)' )
+    parser.add_argument( '--zip', default = None, choices = [ 'deflated', 'stored' ],
+        help = 'Create a zip file instead of a directory' )
+    parser.add_argument( '--package-name', default = 'liquid4m',
+        help = 'Name of the package which contains the templates' )
+    parser.add_argument( '--package-path', default = 'templates',
+        help = 'Templates directory inside the package' )
+
+    args = parser.parse_args()
+    compileTemplates( args.target, args.zip, args.package_name, args.package_path )
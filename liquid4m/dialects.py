@@ -19,7 +19,136 @@ You should have received a copy of the GNU General Public License
 along with this program. If not, <see http://www.gnu.org/licenses/>.
 """
 
-# dict
+import cgi
+from collections import Mapping
+from urlparse import parse_qs
+
+class MultiDictView( Mapping ):
+
+    """
+    Read-only view of a multi-value dictionary of a web framework. Nothing
+    is copied, the values are looked up only when the form asks for them:
+    a key with one value returns the value, a key with more values returns
+    the list of them. If the encoding is given, the byte string values are
+    decoded only when they are looked up (the invalid bytes are replaced).
+    """
+
+    # void
+    def __init__( self, multidict, encoding = None ):
+
+        """
+        Read-only view of a multi-value dictionary of a web framework.
+
+        @param multidict: Object with getlist() method (MultiDict, 
+            QueryDict) or a dictionary of lists
+        @type multidict: MultiDict
+
+        @param encoding: Encoding of the byte string keys and values (None
+            means they are unicode already)
+        @type encoding: unicode
+        """
+
+        self._multidict = multidict
+        self._encoding = encoding
+        self._getlist = getattr( multidict, 'getlist', None ) \
+            or ( lambda key: multidict.get( key, [] ) )
+
+    # list<type>
+    def getlist( self, key ):
+
+        """
+        Returns the list of values of the key.
+
+        @param key: Name of the variable
+        @type key: unicode
+
+        @return: List of values
+        @rtype: list<type>
+        """
+
+        if self._encoding is None:
+            return self._getlist( key )
+
+        return [ value.decode( self._encoding, 'replace' ) \
+            if isinstance( value, str ) \
+            else value \
+            for value in self._getlist( self._encodeKey( key ) ) ]
+
+    # type
+    def __getitem__( self, key ):
+
+        """
+        Returns the value (or the list of values) of the key.
+
+        @param key: Name of the variable
+        @type key: unicode
+
+        @return: Value or list of values
+        @rtype: type
+        """
+
+        values = self.getlist( key )
+        if not values:
+            raise KeyError( key )
+
+        return values[0] \
+            if len( values ) == 1 \
+            else values
+
+    # type
+    def get( self, key, default = None ):
+
+        """
+        Returns the value (or the list of values) of the key. If the key
+        is not found it returns the default value.
+
+        @param key: Name of the variable
+        @type key: unicode
+
+        @param default: Returned value if the key is not found
+        @type default: type
+
+        @return: Value or list of values
+        @rtype: type
+        """
+
+        values = self.getlist( key )
+        if not values:
+            return default
+
+        return values[0] \
+            if len( values ) == 1 \
+            else values
+
+    # bool
+    def __contains__( self, key ):
+
+        return self._encodeKey( key ) in self._multidict
+
+    # iterator<unicode>
+    def __iter__( self ):
+
+        if self._encoding is None:
+            return iter( self._multidict.keys() )
+
+        return ( key.decode( self._encoding, 'replace' ) \
+            if isinstance( key, str ) \
+            else key \
+            for key in self._multidict.keys() )
+
+    # int
+    def __len__( self ):
+
+        return len( self._multidict )
+
+    # str
+    def _encodeKey( self, key ):
+
+        return key.encode( self._encoding ) \
+            if self._encoding is not None and isinstance( key, unicode ) \
+            else key
+
+# dialects.MultiDictView
 def flask( request_values ):
 
     """
@@ -30,12 +159,66 @@ def flask( request_values ):
     @type request_values: MultiDict
 
     @return: Liquid Form compatible dictionary
-    @rtype: dict
+    @rtype: dialects.MultiDictView
+    """
+
+    return MultiDictView( request_values )
+
+# dialects.MultiDictView
+def django( query_dict ):
+
+    """
+    Django web framework dialect to convert request.GET or request.POST 
+    variable into Liquid Form compatible dictionary.
+
+    @param query_dict: Request variables
+    @type query_dict: QueryDict
+
+    @return: Liquid Form compatible dictionary
+    @rtype: dialects.MultiDictView
+    """
+
+    return MultiDictView( query_dict )
+
+# dialects.MultiDictView
+def wsgi( environ, encoding = 'utf-8' ):
+
+    """
+    WSGI dialect to parse the query string and the posted (url encoded or
+    multipart) body into Liquid Form compatible dictionary. The keys and
+    values are decoded only when the form looks them up, the uploaded 
+    files are cgi.FieldStorage objects. The request body is read, so it 
+    could be called only once per request.
+
+    @param environ: WSGI environment
+    @type environ: dict
+
+    @param encoding: Encoding of the request
+    @type encoding: unicode
+
+    @return: Liquid Form compatible dictionary
+    @rtype: dialects.MultiDictView
     """
 
-    data = { key : ( request_values[ key ] \
-        if len( request_values.getlist( key ) ) == 1 \
-        else request_values.getlist( key ) ) \
-        for key in request_values.keys() }
+    data = parse_qs( environ.get( 'QUERY_STRING', '' ), keep_blank_values = True )
+
+    content_type = environ.get( 'CONTENT_TYPE', '' )
+    if environ.get( 'REQUEST_METHOD', 'GET' ).upper() in ( 'POST', 'PUT', 'PATCH' ):
+        if content_type.startswith( 'multipart/form-data' ):
+            storage = cgi.FieldStorage( 
+                fp = environ['wsgi.input'], 
+                environ = dict( environ, QUERY_STRING = '' ),
+                keep_blank_values = True 
+            )
+            for item in storage.list or []:
+                data.setdefault( item.name, [] ).append( item.value \
+                    if item.filename is None \
+                    else item )
+
+        elif content_type.startswith( 'application/x-www-form-urlencoded' ):
+            length = int( environ.get( 'CONTENT_LENGTH' ) or 0 )
+            body = environ['wsgi.input'].read( length )
+            for key, values in parse_qs( body, keep_blank_values = True ).items():
+                data.setdefault( key, [] ).extend( values )
 
-    return data
+    return MultiDictView( data, encoding )
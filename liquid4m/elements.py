@@ -22,6 +22,23 @@ along with this program. If not, <see http://www.gnu.org/licenses/>.
 from bisect import bisect
 from . import state, widgets, exceptions, validators
 
+# object
+def copy( obj ):
+
+    """
+    Shallow copy of the given object without calling its constructor.
+
+    @param obj: Copied object
+    @type obj: object
+
+    @return: New object with the same attributes
+    @rtype: object
+    """
+
+    clone = obj.__class__.__new__( obj.__class__ )
+    clone.__dict__.update( obj.__dict__ )
+    return clone
+
 class ElementBase( type ):
 
     """
@@ -63,10 +80,143 @@ class ElementBase( type ):
             # Collect them into a list for ordering purposes
             elements.insert( bisect( elements, value ), value )
 
-        # Save the collected list
+        # Save the collected list and compile the schema plan
         klass._elements = elements
+        klass._plan = Plan( elements )
         return klass
 
+class Plan( object ):
+
+    """
+    Compiled schema plan of an ElementCollector class. It is created once
+    per class and records the ordering and the absolute names of the
+    children, so the schema is not inspected again for every Form.
+    """
+
+    # void
+    def __init__( self, elements ):
+
+        """
+        Compiled schema plan of an ElementCollector class. It is created once
+        per class and records the ordering and the absolute names of the
+        children, so the schema is not inspected again for every Form.
+
+        @param elements: Ordered list of the collected elements
+        @type elements: list<elements.Element>
+        """
+
+        self._element_names = [ element.getName() for element in elements ]
+        self._plans = [ element._plan \
+            if isinstance( element, ElementCollector ) \
+            else None \
+            for element in elements ]
+
+        self._abs_names = {}
+        self._field_paths = {}
+        self._collector_names = {}
+
+    # list<unicode>
+    def getElementNames( self ):
+
+        """
+        Returns the ordered list of the children's name.
+
+        @return: List of names
+        @rtype: list<unicode>
+        """
+
+        return self._element_names
+
+    # list<unicode>
+    def getAbsNames( self, parent_abs_name = None ):
+
+        """
+        Returns the ordered list of the children's absolute name under the
+        given parent. The names are calculated only once per parent.
+
+        @param parent_abs_name: Parent's absolute name
+        @type parent_abs_name: unicode
+
+        @return: List of absolute names
+        @rtype: list<unicode>
+        """
+
+        try:
+            return self._abs_names[ parent_abs_name ]
+
+        except KeyError:
+            return self._abs_names.setdefault( parent_abs_name, [ name \
+                if parent_abs_name is None \
+                else '{}_{}'.format( parent_abs_name, name ) \
+                for name in self._element_names ] )
+
+    # dict<unicode,tuple<unicode>>
+    def getFieldPaths( self, parent_abs_name = None ):
+
+        """
+        Returns the absolute names of every field under the given parent
+        (children of the child collectors too) with their path of names
+        relative to the parent. It is calculated only once per parent.
+
+        @param parent_abs_name: Parent's absolute name
+        @type parent_abs_name: unicode
+
+        @return: Path of names by absolute name
+        @rtype: dict<unicode,tuple<unicode>>
+        """
+
+        try:
+            return self._field_paths[ parent_abs_name ]
+
+        except KeyError:
+            pass
+
+        paths = {}
+        stack = [ ( self, parent_abs_name, () ) ]
+        while stack:
+            plan, abs_name, path = stack.pop()
+            for name, child_abs_name, child_plan in zip( plan._element_names, 
+                    plan.getAbsNames( abs_name ), plan._plans ):
+
+                if child_plan is None:
+                    paths[ child_abs_name ] = path + ( name, )
+
+                else:
+                    stack.append( ( child_plan, child_abs_name, path + ( name, ) ) )
+
+        return self._field_paths.setdefault( parent_abs_name, paths )
+
+    # frozenset<unicode>
+    def getCollectorNames( self, parent_abs_name = None ):
+
+        """
+        Returns the absolute names of every collector (eg. FieldSet) under
+        the given parent. It is calculated only once per parent.
+
+        @param parent_abs_name: Parent's absolute name
+        @type parent_abs_name: unicode
+
+        @return: Set of absolute names
+        @rtype: frozenset<unicode>
+        """
+
+        try:
+            return self._collector_names[ parent_abs_name ]
+
+        except KeyError:
+            pass
+
+        names = set()
+        stack = [ ( self, parent_abs_name ) ]
+        while stack:
+            plan, abs_name = stack.pop()
+            for child_abs_name, child_plan in zip( plan.getAbsNames( abs_name ), plan._plans ):
+                if child_plan is not None:
+                    names.add( child_abs_name )
+                    stack.append( ( child_plan, child_abs_name ) )
+
+        return self._collector_names.setdefault( parent_abs_name, frozenset( names ) )
+
 class Element( object ):
 
     """
@@ -79,8 +229,11 @@ class Element( object ):
     # Default validators for the element
     _default_validators = []
 
-    # Number of creation (used by ordering)
+    # Number of creation (used by the IDs, every copy gets a new one)
     _creation_counter = 0
+
+    # Position of the element in the schema (used by ordering)
+    _order = 0
  
     # void
     def __init__( self, name = None, label = None, hidden = False, \
@@ -127,6 +280,7 @@ class Element( object ):
 
         # Save default variables
         self._creation_counter = Element._creation_counter
+        self._order = Element._creation_counter
         self._cls = cls
         self._abs_name = None
 
@@ -170,7 +324,45 @@ class Element( object ):
         @rtype: int
         """
 
-        return cmp( self._creation_counter, other._creation_counter )
+        return cmp( self._order, other._order )
+
+    # elements.Element
+    def clone( self ):
+
+        """
+        Create a copy of the schema element for a Form. The copy allocates
+        only its own state and list of validators, the other objects
+        (widget, validators, options, etc.) are shared with the schema
+        element until they are replaced.
+        The copy gets a new creation counter, so the forms of the same
+        schema have different IDs (its order is kept).
+
+        @return: Copy of the element
+        @rtype: elements.Element
+        """
+
+        clone = copy( self )
+        clone._schema = self.getSchema()
+        clone._state = self._state.copy()
+        clone._creation_counter = Element._creation_counter
+        clone._validators = list( self._validators )
+
+        Element._creation_counter += 1
+
+        return clone
+
+    # elements.Element
+    def getSchema( self ):
+
+        """
+        Returns the schema element which was the source of the copy. If the
+        element is not a copy, it returns the element itself.
+
+        @return: Schema element
+        @rtype: elements.Element
+        """
+
+        return self.__dict__.get( '_schema', self )
 
     # void
     def setName( self, name ):
@@ -249,6 +441,10 @@ class Element( object ):
         @type widget: widgets.Widget
         """
 
+        # Copy the widget before the change, it is shared with the schema
+        if self._widget is self.getSchema()._widget and self.getSchema() is not self:
+            self._widget = copy( self._widget )
+
         self._widget.setErrorWidget( widget )
 
     # void
@@ -256,13 +452,14 @@ class Element( object ):
 
         """
         Set the element's validators. Its responsible for to check the given
-        element.
+        element. The validation plan is compiled from them on its first use.
 
         @param validator_list: List of validator objects
         @type validator_list: list<validator.Validator>
         """
 
         self._validators = []
+        self._validation_plan = None
 
         # Set the dafult validators
         if self._default_validators and isinstance( 
@@ -275,14 +472,11 @@ class Element( object ):
 
             self._validators += self._default_validators
 
-        if validator_list is None:
-            return
-
         # Set the given validators
         if isinstance( validator_list, validators.Validator ):
             self._validators += [ validator_list ]
 
-        else:
+        elif validator_list is not None:
             self._validators += validator_list
 
     # unicode
@@ -362,11 +556,24 @@ class Element( object ):
 
         return self._state
 
+    # widgets.Widget
+    def getWidget( self ):
+
+        """
+        Returns the widget of the element.
+
+        @return: Widget object
+        @rtype: widgets.Widget
+        """
+
+        return self._widget
+
     # list<validators.Validator>
     def getValidators( self ):
 
         """
-        Returns the list of the selected validators.
+        Returns the list of the selected validators. Every copy of the
+        element has its own list, so it could be changed in place.
 
         @return: List of validator objects
         @rtype: list<validators.Validator>
@@ -374,6 +581,31 @@ class Element( object ):
 
         return self._validators
 
+    # list<validators.Validator>
+    def getValidationPlan( self ):
+
+        """
+        Returns the compiled validation plan of the selected validators:
+        the validators in the order of the checks, the nested And validators
+        are unfolded. It is compiled again only if the validators are
+        changed, the copies of the element with the same validators share
+        the plan of the schema element.
+
+        @return: Flat list of validator objects
+        @rtype: list<validators.Validator>
+        """
+
+        key = tuple( self._validators )
+        if self._validation_plan is None or self._validation_plan[0] != key:
+            schema = self.getSchema()
+            plan = schema.getValidationPlan() \
+                if schema is not self and tuple( schema._validators ) == key \
+                else validators.compilePlan( self._validators )
+
+            self._validation_plan = ( key, plan )
+
+        return self._validation_plan[1]
+
     # unicode
     def render( self ):
 
@@ -387,6 +619,18 @@ class Element( object ):
 
         return self._widget.render( self )
 
+    # generator<unicode>
+    def generate( self ):
+
+        """
+        Render the element chunk by chunk with the selected widget object.
+
+        @return: HTML chunks of the element
+        @rtype: generator<unicode>
+        """
+
+        return self._widget.generate( self )
+
 class ElementCollector( object ):
 
     """
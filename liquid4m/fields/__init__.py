@@ -19,7 +19,8 @@ You should have received a copy of the GNU General Public License
 along with this program. If not, <see http://www.gnu.org/licenses/>.
 """
 
-import types as t, inspect
+import types as t
+import json
 from .. import widgets, form, exceptions, elements
 from . import validators, types
 from .options import OptionsInterface, Options
@@ -28,6 +29,9 @@ class Field( elements.Element ):
 
     _default_type = None
 
+    # Validator of the required fields
+    _required_validator = validators.Required()
+
     # void
     def __init__( self, name = None, value = None, label = None, placeholder = None, hint = None, \
                   hidden = False, readonly = False, disabled = False, focus = False, error = None, \
@@ -37,6 +41,7 @@ class Field( elements.Element ):
         self._hint = hint
         self._type = type or self._default_type()
         self._value = None
+        self._dirty = False
 
         self.setValue( value )
 
@@ -60,37 +65,33 @@ class Field( elements.Element ):
             type = type
         ) )
 
-    # Field
-    def clone( self ):
-
-        clone_dict = self._init
-        clone_dict.update( self.getState().getState() )
-        clone_dict['value'] = self.getValue()
-        clone_dict['name'] = self.getName()
+    # void
+    def validate( self ):
 
-        init_args = set( list( 
-            inspect.getargspec( self.__class__.__init__ ).args 
-        ) )
-        init_args.remove('self')
+        validators.run( self.iterValidate( inline = True ) )
 
-        return self.__class__(
-            **{ k:v for k,v in clone_dict.items() if k in init_args }
-        )
+    # generator<validators.Task>
+    def iterValidate( self, executor = None, inline = False ):
 
-    # void
-    def validate( self ):
+        if executor is not None:
+            yield executor.submit( self.validate )
+            return
 
         if not self.getState().isActive():
             return
 
         if self.getState().isRequired():
-            validators.Required().validate( self )
+            self._required_validator.validate( self )
 
         if self.getValue() is None:
             return
 
-        for validator in self.getValidators():
-            validator.validate( self )
+        for validator in self.getValidationPlan():
+            if not inline and isinstance( validator, validators.AsyncValidator ):
+                validator.complete( self, ( yield validator.start( self ) ) )
+
+            else:
+                validator.validate( self )
 
     # tuple<bool,list>
     def isValid( self ):
@@ -102,6 +103,16 @@ class Field( elements.Element ):
         except exceptions.ValidationError as e:
             return False, [( self.getName(), e.msg )]
 
+    # tuple<bool,list>
+    def isValidAsync( self, executor = None ):
+
+        try:
+            validators.run( self.iterValidate( executor ) )
+            return True, []
+
+        except exceptions.ValidationError as e:
+            return False, [( self.getName(), e.msg )]
+
     # void
     def _setValue( self, value ):
 
@@ -121,19 +132,36 @@ class Field( elements.Element ):
     def setValue( self, value ):
 
         self._setValue( value )
+        self._dirty = True
 
     # void
     def delValue( self ):
 
         self._setValue( None )
+        self._dirty = True
 
     value = property( getValue, setValue, delValue )
 
+    # bool
+    def isDirty( self ):
+
+        return self._dirty
+
+    # void
+    def setDirty( self, dirty = True ):
+
+        self._dirty = dirty
+
     # unicode
     def getPlaceholder( self ):
 
         return self._placeholder
 
+    # types.Type
+    def getType( self ):
+
+        return self._type
+
     # type
     def getTypeValue( self, value ):
 
@@ -288,10 +316,87 @@ class Select( Field, OptionsInterface ):
 
         return self._multiple
 
+    # bool
+    def hasStaticOptions( self ):
+
+        return self._options.isStatic()
+
+    # options.Option
+    def getOption( self, value ):
+
+        return self._options.getIndex( self ).get( value )
+
+    # bool
+    def isSelected( self, value ):
+
+        if self.isMultiple():
+            return value in self.getValue()
+
+        return value == self.getValue()
+
+    # tuple<list,list,unicode>
+    def getRenderedOptions( self ):
+
+        """
+        Returns the rendered options markup (split at the selection markers),
+        the values belonging to the markers and the placeholder of the
+        element's ID. Static option lists are rendered only once per field,
+        the selection and the ID (which is different in every form) are
+        patched for every request.
+
+        @return: Parts of the markup, the list of (value, marker) and the
+            placeholder of the ID
+        @rtype: tuple<list<unicode>,list<tuple<type,unicode>>,unicode>
+        """
+
+        cache = self._options.getRenderCache()
+        key = ( self.getAbsName(), self.getState().getSnapshot()[0] )
+
+        try:
+            return cache[ key ]
+
+        except KeyError:
+            pass
+
+        marks = []
+        placeholder = widgets.createMarker()
+        id_placeholder = widgets.createMarker()
+
+        # unicode
+        def mark( option, marker ):
+
+            marks.append( ( option.getValue( self ), marker ) )
+            return placeholder
+
+        html = widgets.Options( self, mark = mark ).render( self.getOptions() )
+        if self.getID() is not None:
+            html = html.replace( self.getID(), id_placeholder )
+
+        return cache.setdefault( key, ( html.split( placeholder ), marks, id_placeholder ) )
+
     # unicode
     def renderOptions( self, *args ):
 
-        return widgets.Options( self ).render( self.getOptions() )
+        if not self.hasStaticOptions():
+            return widgets.Options( self ).render( self.getOptions() )
+
+        parts, marks, id_placeholder = self.getRenderedOptions()
+        html = [ parts[0] ]
+        for ( value, marker ), part in zip( marks, parts[1:] ):
+            if self.isSelected( value ):
+                html.append( marker )
+
+            html.append( part )
+
+        return u''.join( html ).replace( id_placeholder, self.getID() or u'' )
+
+    # generator<unicode>
+    def generateOptions( self, *args ):
+
+        if not self.hasStaticOptions():
+            return widgets.Options( self ).generate( self.getOptions() )
+
+        return iter([ self.renderOptions() ])
 
     # void
     def _setValue( self, value ):
@@ -416,15 +521,20 @@ class Autocomplete( Select ):
 
     _default_widget = widgets.Autocomplete,
 
+    # Number of search results on a page by default and at most
+    default_per_page = 20
+    max_per_page = 100
+
     # void
     def __init__( self, options, name = None, value = None, label = None, \
                   multiple = False, placeholder = None, hint = None, hidden = False, \
                   readonly = False, disabled = False, focus = False, required = False, \
                   error = None, widget = None, validators = None, cls = None, \
-                  min_search_length = 0, extendable = False ):
+                  min_search_length = 0, extendable = False, url = None ):
 
         self._min_search_length = int( min_search_length )
         self._extendable = extendable
+        self._url = url
 
         super( Autocomplete, self ).__init__( 
             name = name, 
@@ -480,10 +590,105 @@ class Autocomplete( Select ):
 
         return self.getValue()
 
+    # dict
+    def getSearchResult( self, value ):
+
+        option = self.getOption( value )
+
+        return {
+            'id': value,
+            'text': option.getLabel() if option is not None else value
+        }
+
+    # list<dict> | dict
+    def getSelectedOptions( self ):
+
+        if self.isMultiple():
+            return [ self.getSearchResult( value ) for value in sorted( self.getValue() ) ]
+
+        if self.getValue() is None:
+            return None
+
+        return self.getSearchResult( self.getValue() )
+
+    # dict
+    def search( self, query, page = 1, per_page = None ):
+
+        """
+        Search in the options' labels for the remote mode. The result is
+        paginated and it is empty while the query is shorter than the
+        minimum search length. The invalid page parameters are replaced
+        by the defaults and the page size is limited by max_per_page.
+
+        @param query: Searched text
+        @type query: unicode
+
+        @param page: Number of the page (starts with 1)
+        @type page: int
+
+        @param per_page: Number of results on a page (None means
+            default_per_page)
+        @type per_page: int
+
+        @return: Matching options and the existence of the next page
+        @rtype: dict
+        """
+
+        query = ( query or u'' ).strip()
+        if len( query ) < self.getMinSearchLength():
+            return { 'results': [], 'more': False }
+
+        try:
+            page = max( int( page ), 1 )
+
+        except ( TypeError, ValueError ):
+            page = 1
+
+        try:
+            per_page = min( max( int( per_page ), 1 ), self.max_per_page )
+
+        except ( TypeError, ValueError ):
+            per_page = self.default_per_page
+
+        start = ( page - 1 ) * per_page
+
+        matches = self._options.getSearchIndex().search( query )
+
+        return {
+            'results': [{
+                'id': option.getValue( self ),
+                'text': option.getLabel()
+            } for option in matches[ start:start + per_page ] ],
+            'more': len( matches ) > start + per_page
+        }
+
+    # unicode
+    def searchJSON( self, query, page = 1, per_page = None ):
+
+        """
+        Framework independent handler of the remote mode's search requests.
+        It returns the JSON response of the search method.
+
+        @param query: Searched text
+        @type query: unicode
+
+        @param page: Number of the page (starts with 1)
+        @type page: int
+
+        @param per_page: Number of results on a page (None means
+            default_per_page)
+        @type per_page: int
+
+        @return: JSON response
+        @rtype: unicode
+        """
+
+        return json.dumps( self.search( query, page, per_page ) )
+
     # void
     def _setValue( self, value ):
 
-        if not self.isExtendable():
+        if not self.isExtendable() and not self.isRemote():
             return super( Autocomplete, self )._setValue( value )
 
         if self.isMultiple():
@@ -513,3 +718,13 @@ class Autocomplete( Select ):
     def isExtendable( self ):
 
         return self._extendable
+
+    # unicode
+    def getURL( self ):
+
+        return self._url
+
+    # bool
+    def isRemote( self ):
+
+        return self._url is not None
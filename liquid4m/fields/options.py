@@ -19,7 +19,9 @@ You should have received a copy of the GNU General Public License
 along with this program. If not, <see http://www.gnu.org/licenses/>.
 """
 
+from weakref import WeakKeyDictionary
 from .. import widgets
+from ..cache import LRUCache
 
 # list<Option>
 def generate( iterable ):
@@ -44,6 +46,92 @@ def generate( iterable ):
 
     return rlist
 
+# func
+def cached( ttl = None, cache = None, key = None ):
+
+    """
+    Decorator for option functions to cache the generated options.
+
+    @param ttl: Lifetime of the options in seconds (None means forever)
+    @type ttl: float
+
+    @param cache: Shared cache object (its own ttl and size are used)
+    @type cache: cache.LRUCache
+
+    @param key: Key of the options in the cache (default is the function)
+    @type key: type
+
+    @return: Decorator
+    @rtype: func
+    """
+
+    # CachedOptions
+    def decorator( fn ):
+
+        return CachedOptions( fn, ttl = ttl, cache = cache, key = key )
+
+    return decorator
+
+class CachedOptions( object ):
+
+    """
+    Caching wrapper of an option function. The function is called only when
+    the cached options are expired or invalidated, so expensive providers
+    (database queries, files) are not evaluated for every access.
+    """
+
+    # void
+    def __init__( self, fn, ttl = None, cache = None, key = None ):
+
+        """
+        Caching wrapper of an option function. The function is called only 
+        when the cached options are expired or invalidated.
+
+        @param fn: Option function
+        @type fn: func
+
+        @param ttl: Lifetime of the options in seconds (None means forever)
+        @type ttl: float
+
+        @param cache: Shared cache object (its own ttl and size are used)
+        @type cache: cache.LRUCache
+
+        @param key: Key of the options in the cache (default is the function)
+        @type key: type
+        """
+
+        self._fn = fn
+        self._key = key or fn
+        self._cache = cache \
+            if cache is not None \
+            else LRUCache( max_size = 1, ttl = ttl )
+
+    # list<Option>
+    def __call__( self ):
+
+        """
+        Returns the cached options. The generators are evaluated into a list.
+
+        @return: List of Options
+        @rtype: list<Option>
+        """
+
+        options = self._cache.get( self._key )
+        if options is None:
+            options = [ option for option in self._fn() ]
+            self._cache.set( self._key, options )
+
+        return options
+
+    # void
+    def invalidate( self ):
+
+        """
+        Drop the cached options, the function will be called again.
+        """
+
+        self._cache.invalidate( self._key )
+
 class Options( object ):
 
     """
@@ -75,6 +163,10 @@ class Options( object ):
         @type: list<Option> | generator | func
         """
 
+        self._rendered = {}
+        self._index = WeakKeyDictionary()
+        self._search = None
+
         if options is None:
             self._options, self._fn = [], None
 
@@ -87,6 +179,9 @@ class Options( object ):
         else:
             self._options, self._fn = [], options 
 
+        self._groups = [ option for option in self._options \
+            if isinstance( option, OptionsInterface ) ]
+
     # list<Option>
     def getOptions( self, level = 0 ):
 
@@ -105,6 +200,217 @@ class Options( object ):
             for option in ( self._options if self._fn is None else self._fn() ) \
             if isinstance( option, Option ) )
 
+    # dict
+    def getIndex( self, element ):
+
+        """
+        Returns an index of the options by their converted values (option
+        groups are flattened). For static option lists the index is built
+        only once per type (it is released with the type object).
+
+        @param element: Checked object (Field, FieldSet, etc.)
+        @type element: elements.Element
+
+        @return: Options by converted values
+        @rtype: dict<type,Option>
+        """
+
+        if self.isStatic() and element.getType() in self._index:
+            return self._index[ element.getType() ]
+
+        index = {}
+        stack = list( self.getOptions() )[::-1]
+        while stack:
+            option = stack.pop()
+            if isinstance( option, OptionsInterface ):
+                stack.extend( list( option.getOptions() )[::-1] )
+
+            value = option.getValue( element ) \
+                if not isinstance( option, OptionGroup ) \
+                else None
+
+            if value is not None:
+                index.setdefault( value, option )
+
+        if self.isStatic():
+            self._index[ element.getType() ] = index
+
+        return index
+
+    # bool
+    def isStatic( self ):
+
+        """
+        Returns the options are defined by a static list (or generator) and
+        not by a function, including the options of the nested groups.
+
+        @return: Is static?
+        @rtype: bool
+        """
+
+        return self._fn is None and \
+            all( group._options.isStatic() for group in self._groups )
+
+    # dict
+    def getRenderCache( self ):
+
+        """
+        Returns the cache of the rendered option lists. It is emptied when
+        the options are changed.
+
+        @return: Rendered option lists
+        @rtype: dict
+        """
+
+        return self._rendered
+
+    # SearchIndex
+    def getSearchIndex( self ):
+
+        """
+        Returns the search index of the options' labels. The index is built
+        on the first search and it is kept until the options are changed. For
+        option functions it is rebuilt only when the function returns a new
+        list (see cached decorator).
+
+        @return: Search index
+        @rtype: SearchIndex
+        """
+
+        source = self._options if self._fn is None else self._fn()
+        if self._search is None or self._search[0] is not source:
+            self._search = ( source, SearchIndex( source ) )
+
+        return self._search[1]
+
+class SearchIndex( object ):
+
+    """
+    In-memory search index over the labels of the selectable options. Short
+    queries are matched against the beginning of the words, longer queries
+    are looked up by their trigrams and matched anywhere in the label.
+    """
+
+    # Length of the indexed word prefixes (longer queries use the trigrams)
+    prefix_length = 2
+
+    # void
+    def __init__( self, options ):
+
+        """
+        In-memory search index over the labels of the selectable options.
+        Disabled options, disabled groups and options without value are not
+        indexed.
+
+        @param options: List of Options
+        @type options: list<Option>
+        """
+
+        self._options = []
+        self._labels = []
+        self._prefixes = {}
+        self._trigrams = {}
+
+        stack = [ option for option in options if isinstance( option, Option ) ][::-1]
+        while stack:
+            option = stack.pop()
+            if option.isDisabled():
+                continue
+
+            if isinstance( option, OptionsInterface ):
+                stack.extend( list( option.getOptions() )[::-1] )
+
+            if isinstance( option, OptionGroup ) or option._value is None:
+                continue
+
+            self.add( option )
+
+    # unicode
+    def normalize( self, text ):
+
+        """
+        Returns the searchable form of the given text.
+
+        @param text: Label or query
+        @type text: unicode
+
+        @return: Normalized text
+        @rtype: unicode
+        """
+
+        return u' '.join( unicode( text or u'' ).lower().split() )
+
+    # void
+    def add( self, option ):
+
+        """
+        Add an option to the index. The posting lists are kept in the order
+        of the options.
+
+        @param option: Indexed option
+        @type option: Option
+        """
+
+        position = len( self._options )
+        label = self.normalize( option.getLabel() )
+
+        self._options.append( option )
+        self._labels.append( label )
+
+        keys = { word[:length] for word in label.split() \
+            for length in range( 1, self.prefix_length + 1 ) }
+        for key in keys:
+            self._prefixes.setdefault( key, [] ).append( position )
+
+        keys = { label[i:i+3] for i in range( len( label ) - 2 ) }
+        for key in keys:
+            self._trigrams.setdefault( key, [] ).append( position )
+
+    # list<Option>
+    def search( self, query ):
+
+        """
+        Returns the matching options. Options whose label starts with the
+        query come first, the others keep the original order.
+
+        @param query: Searched text
+        @type query: unicode
+
+        @return: List of matching Options
+        @rtype: list<Option>
+        """
+
+        query = self.normalize( query )
+        if not query:
+            return list( self._options )
+
+        labels = self._labels
+        if len( query ) <= self.prefix_length:
+            positions = self._prefixes.get( query, [] )
+
+        else:
+            postings = sorted([ self._trigrams.get( query[i:i+3], [] ) \
+                for i in range( len( query ) - 2 ) ], key = len )
+
+            others = [ set( posting ) for posting in postings[1:] ]
+            positions = [ p for p in postings[0] \
+                if all( p in other for other in others ) and query in labels[p] ]
+
+        return [ self._options[p] for p in positions if labels[p].startswith( query ) ] + \
+            [ self._options[p] for p in positions if not labels[p].startswith( query ) ]
+
+    # int
+    def __len__( self ):
+
+        """
+        Returns the number of the indexed options.
+
+        @return: Number of options
+        @rtype: int
+        """
+
+        return len( self._options )
+
 class OptionsInterface( object ):
 
     """
@@ -115,13 +421,15 @@ class OptionsInterface( object ):
     def setOptions( self, options ):
 
         """
-        Set a list of Option with the help of Options object.
+        Set a list of Option with the help of Options object. The Options
+        object could be shared with the schema element, so a new one is
+        created instead of modifying it.
 
         @param options: List of Options
         @type: list<Option> | generator | func
         """
 
-        self._options.setOptions( options )
+        self._options = Options( options )
 
     # list<Option>
     def getOptions( self, level = 0 ):
@@ -164,6 +472,7 @@ class Option( object ):
         self._label = label
         self._disabled = disabled
         self._level = 0
+        self._values = WeakKeyDictionary()
 
     # void
     def setLevel( self, level ):
@@ -218,7 +527,9 @@ class Option( object ):
     def getValue( self, element ):
 
         """
-        Returns the converted value of the Option.
+        Returns the converted value of the Option. The value is converted
+        only once per type, the values are released with the type objects
+        (the options could be shared by the schemas of the requests).
 
         @param element: Checked object (Field, FieldSet, etc.)
         @type element: elements.Element
@@ -227,7 +538,12 @@ class Option( object ):
         @rtype: type
         """
 
-        return element.getTypeValue( self._value )
+        try:
+            return self._values[ element.getType() ]
+
+        except KeyError:
+            return self._values.setdefault( element.getType(), 
+                element.getTypeValue( self._value ) )
 
     # unicode
     def getLabel( self, levelled = False ):
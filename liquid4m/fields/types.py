@@ -23,6 +23,12 @@ import datetime, re
 from dateutil import parser
 from ..exceptions import TypeConversionError
 
+try:
+    import numpy
+
+except ImportError:
+    numpy = None
+
 class Type( object ):
 
     """
@@ -127,6 +133,65 @@ class Type( object ):
         except:
             raise TypeConversionError()
 
+    # type
+    def convertString( self, value ):
+
+        """
+        Converts a not empty unicode string for the convertMany method. If 
+        it fails the value is converted by the getValue method.
+
+        @param value: Not empty unicode value
+        @type value: unicode
+
+        @return: Converted value
+        @rtype: type
+        """
+
+        return self.getValue( value )
+
+    # tuple<list,list<bool>>
+    def convertMany( self, values ):
+
+        """
+        Converts a column of values at once. The result is the same as the
+        getValue's for every value, but the unicode strings are converted
+        without the general checks.
+
+        @param values: List of values
+        @type values: list<type>
+
+        @return: Converted values and the conversion failures
+        @rtype: tuple<list<type>,list<bool>>
+        """
+
+        converted, failures = [], []
+        convertString, getValue = self.convertString, self.getValue
+
+        for value in values:
+            if isinstance( value, unicode ):
+                if not value.strip():
+                    converted.append( None )
+                    failures.append( False )
+                    continue
+
+                try:
+                    converted.append( convertString( value ) )
+                    failures.append( False )
+                    continue
+
+                except Exception:
+                    pass
+
+            try:
+                converted.append( getValue( value ) )
+                failures.append( False )
+
+            except TypeConversionError:
+                converted.append( None )
+                failures.append( True )
+
+        return converted, failures
+
 class String( Type ):
 
     """
@@ -166,6 +231,21 @@ class String( Type ):
 
         return value.strip()
 
+    # unicode
+    def convertString( self, value ):
+
+        """
+        Strips the unicode string for the convertMany method.
+
+        @param value: Not empty unicode value
+        @type value: unicode
+
+        @return: Converted value
+        @rtype: unicode
+        """
+
+        return value.strip()
+
 class Integer( Type ):
     
     """
@@ -194,6 +274,21 @@ class Integer( Type ):
         except:
             return int( float( re.sub( r',', '.', value ) ) )
 
+    # int
+    def convertString( self, value ):
+
+        """
+        Converts the unicode string into integer for the convertMany method.
+
+        @param value: Not empty unicode value
+        @type value: unicode
+
+        @return: Converted value
+        @rtype: int
+        """
+
+        return int( value )
+
 class Float( Type ):
     
     """
@@ -204,7 +299,7 @@ class Float( Type ):
     _default_types = [ float ]
 
     # float
-    def _convert( self, value ):
+    def convert( self, value ):
 
         """
         Converts a value into float.
@@ -213,7 +308,7 @@ class Float( Type ):
         @type value: type
 
         @return: Converted value
-        @type: unicode
+        @type: float
         """
 
         try:
@@ -222,6 +317,21 @@ class Float( Type ):
         except:
             return float( re.sub( r',', '.', value ) )
 
+    # float
+    def convertString( self, value ):
+
+        """
+        Converts the unicode string into float for the convertMany method.
+
+        @param value: Not empty unicode value
+        @type value: unicode
+
+        @return: Converted value
+        @rtype: float
+        """
+
+        return float( value )
+
 class Boolean( Type ):
 
     """
@@ -231,6 +341,10 @@ class Boolean( Type ):
     # List of expected types
     _default_types = [ bool ]
 
+    # Values of the strings
+    _values = dict( [ ( v, True ) for v in ( "yes", "y", "true",  "t", "1" ) ] + \
+        [ ( v, False ) for v in ( "no",  "n", "false", "f", "0", "0.0", "", "none", "[]", "{}" ) ] )
+
     # bool
     def convert( self, value ):
 
@@ -252,7 +366,165 @@ class Boolean( Type ):
 
         raise TypeError()
 
-class Date( Type ):
+    # bool
+    def convertString( self, value ):
+
+        """
+        Converts the unicode string into boolean for the convertMany method.
+
+        @param value: Not empty unicode value
+        @type value: unicode
+
+        @return: Converted value
+        @rtype: bool
+        """
+
+        return self._values[ value.lower() ]
+
+class Temporal( Type ):
+
+    """
+    Base class of the date and time types. The strings are parsed in tiers:
+    strict ISO 8601 (HTML5 date and datetime inputs) first, then the 
+    explicit formats, and dateutil only if all of them fail. The results
+    of the ISO 8601 and format tiers are memoized. The dateutil results are
+    not, they could depend on the current date (eg. missing year).
+    """
+
+    # Pattern of the ISO 8601 date and datetime (without time zone)
+    iso_pattern = re.compile( r'^(\d{4})-(\d{2})-(\d{2})'
+        r'(?:[T ](\d{2}):(\d{2})(?::(\d{2})(?:\.(\d{1,6}))?)?)?$' )
+
+    # Maximum number of memoized strings
+    memo_size = 10000
+
+    # void
+    def __init__( self, formats = None ):
+
+        """
+        Base class of the date and time types.
+
+        @param formats: List of strptime formats tried after the ISO 8601
+        @type formats: list<unicode>
+        """
+
+        self._formats = formats or []
+        self._memo = {}
+
+    # datetime.datetime
+    def parseISO( self, value ):
+
+        """
+        Parse an ISO 8601 string. It returns None if the string is not in
+        this format.
+
+        @param value: Value
+        @type value: unicode
+
+        @return: Datetime object
+        @rtype: datetime.datetime
+        """
+
+        match = self.iso_pattern.match( value )
+        if match is None:
+            return None
+
+        year, month, day, hour, minute, second, fraction = match.groups()
+
+        try:
+            return datetime.datetime( int( year ), int( month ), int( day ), 
+                int( hour or 0 ), int( minute or 0 ), int( second or 0 ),
+                int( ( fraction or u'0' ).ljust( 6, u'0' ) ) )
+
+        except ValueError:
+            return None
+
+    # datetime.datetime
+    def parseFormats( self, value ):
+
+        """
+        Parse the string with the explicit formats. It returns None if none
+        of them matches.
+
+        @param value: Value
+        @type value: unicode
+
+        @return: Datetime object
+        @rtype: datetime.datetime
+        """
+
+        for fmt in self._formats:
+            try:
+                return datetime.datetime.strptime( value, fmt )
+
+            except ValueError:
+                pass
+
+        return None
+
+    # type
+    def parseFallback( self, value ):
+
+        """
+        Parse the string with dateutil.
+
+        @param value: Value
+        @type value: unicode
+
+        @return: Converted value
+        @rtype: type
+        """
+
+        raise RuntimeError( '%(cls)s.parseFallback( value ) is not implemented!' % {
+            'cls': self.__class__.__name__
+        } )
+
+    # type
+    def fromDateTime( self, value ):
+
+        """
+        Converts the parsed datetime object into the expected type.
+
+        @param value: Parsed value
+        @type value: datetime.datetime
+
+        @return: Converted value
+        @rtype: type
+        """
+
+        return value
+
+    # type
+    def parseString( self, value ):
+
+        """
+        Parse the string and return the converted value.
+
+        @param value: Value
+        @type value: unicode
+
+        @return: Converted value
+        @rtype: type
+        """
+
+        try:
+            return self._memo[ value ]
+
+        except KeyError:
+            pass
+
+        parsed = self.parseISO( value ) or self.parseFormats( value )
+        if parsed is None:
+            return self.parseFallback( value )
+
+        # The memo is emptied when it is full
+        if len( self._memo ) >= self.memo_size:
+            self._memo.clear()
+
+        result = self._memo[ value ] = self.fromDateTime( parsed )
+        return result
+
+class Date( Temporal ):
     
     """
     Date type.
@@ -262,10 +534,25 @@ class Date( Type ):
     _default_types = [ datetime.date ]
 
     # datetime.date
-    def parseString( self, value ):
+    def fromDateTime( self, value ):
 
         """
-        Parse the string and return a date object.
+        Converts the parsed datetime object into date object.
+
+        @param value: Parsed value
+        @type value: datetime.datetime
+
+        @return: Date object
+        @rtype: datetime.date
+        """
+
+        return value.date()
+
+    # datetime.date
+    def parseFallback( self, value ):
+
+        """
+        Parse the string with dateutil and return a date object.
 
         @param value: Value
         @type value: unicode
@@ -304,7 +591,51 @@ class Date( Type ):
 
         raise TypeError()
 
-class DateTime( Type ):
+    # datetime.date
+    def convertString( self, value ):
+
+        """
+        Parse the unicode string for the convertMany method.
+
+        @param value: Not empty unicode value
+        @type value: unicode
+
+        @return: Date object
+        @rtype: datetime.date
+        """
+
+        return self.parseString( value )
+
+    # tuple<list,list<bool>>
+    def convertMany( self, values ):
+
+        """
+        Converts a column of values at once. If NumPy is available and all
+        of the values are ISO 8601 date strings, they are parsed by NumPy.
+
+        @param values: List of values
+        @type values: list<type>
+
+        @return: Converted values and the conversion failures
+        @rtype: tuple<list<type>,list<bool>>
+        """
+
+        values = list( values )
+
+        if numpy is not None and values and all( isinstance( value, unicode ) \
+                and len( value ) == 10 and value[4] == value[7] == u'-' \
+                and value[:4].isdigit() and value[:4] != u'0000' for value in values ):
+
+            try:
+                return numpy.array( values ).astype( 'datetime64[D]' ).astype( object ).tolist(), \
+                    [ False ] * len( values )
+
+            except ValueError:
+                pass
+
+        return super( Date, self ).convertMany( values )
+
+class DateTime( Temporal ):
     
     """
     DateTime type.
@@ -313,6 +644,21 @@ class DateTime( Type ):
     # List of expected types
     _default_types = [ datetime.datetime ]
 
+    # datetime.datetime
+    def parseFallback( self, value ):
+
+        """
+        Parse the string with dateutil.
+
+        @param value: Value
+        @type value: unicode
+
+        @return: Datetime object
+        @rtype: datetime.datetime
+        """
+
+        return parser.parse( value )
+
     # datetime.datetime
     def convert( self, value ):
 
@@ -330,9 +676,24 @@ class DateTime( Type ):
             return datetime.datetime( value[0], value[1], value[2], value[3], value[4], value[5] )
 
         if isinstance( value, str ) or isinstance( value, unicode ):
-            return parser.parse( value )
+            return self.parseString( value )
 
         if isinstance( value, datetime.date ):
             return datetime.datetime( value.year, value.month, value.day )
 
         raise TypeError()
+
+    # datetime.datetime
+    def convertString( self, value ):
+
+        """
+        Parse the unicode string for the convertMany method.
+
+        @param value: Not empty unicode value
+        @type value: unicode
+
+        @return: Datetime object
+        @rtype: datetime.datetime
+        """
+
+        return self.parseString( value )
@@ -20,12 +20,40 @@ along with this program. If not, <see http://www.gnu.org/licenses/>.
 """
 
 import re
+from weakref import WeakKeyDictionary
 from phonenumbers import is_valid_number, parse, format_number, PhoneNumberFormat
 from validate_email import validate_email
 from ..exceptions import ValidationError
+from ..cache import LRUCache
 from ..validators import *
 from functools import wraps
 
+# Compiled regular expressions by pattern and flags
+_patterns = {}
+
+# re.RegexObject
+def compilePattern( pattern, flags = 0 ):
+
+    """
+    Returns the compiled regular expression. Every pattern is compiled
+    only once.
+
+    @param pattern: Regular expression
+    @type pattern: unicode
+
+    @param flags: Regular expression flags
+    @type flags: int
+
+    @return: Compiled regular expression
+    @rtype: re.RegexObject
+    """
+
+    try:
+        return _patterns[ ( pattern, flags ) ]
+
+    except KeyError:
+        return _patterns.setdefault( ( pattern, flags ), re.compile( pattern, flags ) )
+
 class Required( Validator ):
 
     """
@@ -274,7 +302,140 @@ class Less( Compare ):
 
         return self.getComparableValue( element ) <= self.getComparableAttribute( element )
 
-class Email( Validator ):
+class MemoizedValidator( Validator ):
+
+    """
+    Base class of the expensive validators whose result depends only on
+    the cache key (by default the class, the validator's configuration and
+    the element's value). The results are stored in a bounded LRU cache,
+    so the repeated values are not checked again.
+    """
+
+    # Cache of the results (shared by every memoized validator)
+    cache = LRUCache( max_size = 4096 )
+
+    # tuple
+    def getConfigKey( self ):
+
+        """
+        Returns the validator's public attributes (except the error message)
+        as a part of the cache key, so the validators of the same class with
+        different settings do not share their results. It is calculated on
+        the first call, the attributes must not be changed afterwards.
+
+        @return: Sorted attribute names and values
+        @rtype: tuple
+        """
+
+        try:
+            return self.__dict__['_config_key']
+
+        except KeyError:
+            return self.__dict__.setdefault( '_config_key', tuple( sorted(
+                ( k, tuple( v ) if isinstance( v, list ) else v ) \
+                for k, v in self.__dict__.items() \
+                if not k.startswith( '_' ) and k != 'msg' ) ) )
+
+    # tuple
+    def getCacheKey( self, element ):
+
+        """
+        Returns the key of the result in the cache.
+
+        @param element: Checked object (Field, FieldSet, etc.)
+        @type element: form.Element
+
+        @return: Cache key
+        @rtype: tuple
+        """
+
+        return ( self.__class__, self.getConfigKey(), element.getValue() )
+
+    # type
+    def check( self, element ):
+
+        """
+        Calculate the result of the validation. Any true value means the
+        element is valid.
+
+        @param element: Checked object (Field, FieldSet, etc.)
+        @type element: form.Element
+
+        @return: Result of the validation
+        @rtype: type
+        """
+
+        raise RuntimeError(
+            '%(cls)s.check( element ) is not implemented.' % {
+                'cls': self.__class__.__name__ 
+            }
+        )
+
+    # type
+    def getResult( self, element ):
+
+        """
+        Returns the cached result of the validation. If the result is not 
+        found it will be calculated and stored. Unhashable values are not
+        cached.
+
+        @param element: Checked object (Field, FieldSet, etc.)
+        @type element: form.Element
+
+        @return: Result of the validation
+        @rtype: type
+        """
+
+        try:
+            key = self.getCacheKey( element )
+            hash( key )
+
+        except:
+            return self._check( element )
+
+        result = self.cache.get( key )
+        if result is None:
+            result = self._check( element )
+            self.cache.set( key, result )
+
+        return result
+
+    # type
+    def _check( self, element ):
+
+        """
+        Calculate the result of the validation. If any error occur it will
+        return False.
+
+        @param element: Checked object (Field, FieldSet, etc.)
+        @type element: form.Element
+
+        @return: Result of the validation
+        @rtype: type
+        """
+
+        try:
+            return self.check( element ) or False
+
+        except:
+            return False
+
+    # bool
+    def isValid( self, element ):
+
+        """
+        Checks the element with the help of the cached result.
+
+        @param element: Checked object (Field, FieldSet, etc.)
+        @type element: form.Element
+
+        @return: The element is valid or not.
+        @rtype: bool
+        """
+
+        return bool( self.getResult( element ) )
+
+class Email( MemoizedValidator ):
 
     """
     Checks the value is a valid email address or not.
@@ -284,8 +445,7 @@ class Email( Validator ):
     msg = u'Please enter a valid email address.'
 
     # bool
-    @invalidateOnError
-    def isValid( self, element ):
+    def check( self, element ):
 
         """
         Checks the value is a valid email address or not.
@@ -299,7 +459,7 @@ class Email( Validator ):
 
         return validate_email( element.getValue() )
 
-class URL( Validator ):
+class URL( MemoizedValidator ):
 
     """
     Checks the value is a valid url or not.
@@ -308,9 +468,18 @@ class URL( Validator ):
     # Default error message if the validation fails
     msg = u'Please enter an URL.'
 
+    # Checked pattern
+    regexp = compilePattern(
+        r'^(?:http|ftp)s?://'
+        r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+(?:[A-Z]{2,6}\.?|[A-Z0-9-]{2,}\.?)|' #domain...
+        r'localhost|' #localhost...
+        r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'
+        r'(?::\d+)?'
+        r'(?:/?|[/?]\S+)$', re.IGNORECASE
+    )
+
     # bool
-    @invalidateOnError
-    def isValid( self, element ):
+    def check( self, element ):
 
         """
         Checks the value is a valid url or not.
@@ -322,17 +491,9 @@ class URL( Validator ):
         @rtype: bool
         """
 
-        regexp = re.compile(
-            r'^(?:http|ftp)s?://'
-            r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+(?:[A-Z]{2,6}\.?|[A-Z0-9-]{2,}\.?)|' #domain...
-            r'localhost|' #localhost...
-            r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'
-            r'(?::\d+)?'
-            r'(?:/?|[/?]\S+)$', re.IGNORECASE
-        )
-        return regexp.match( element.getValue() ) is not None
+        return self.regexp.match( element.getValue() ) is not None
 
-class Telephone( Validator ):
+class Telephone( MemoizedValidator ):
 
     """
     Checks the value is a valid telephone number or not.
@@ -341,36 +502,89 @@ class Telephone( Validator ):
     # Default error message if the validation fails
     msg = u'Please enter a telephone number.'
 
+    # tuple
+    def getCacheKey( self, element ):
+
+        """
+        Returns the key of the result in the cache. The result depends on
+        the element's country code as well.
+
+        @param element: Checked object (Field, FieldSet, etc.)
+        @type element: form.Element
+
+        @return: Cache key
+        @rtype: tuple
+        """
+
+        return ( self.__class__, self.getConfigKey(), element.getValue(), \
+            element.getCountryCode() )
+
     # void
     def reformat( self, element ):
 
         """
         After the validation is over it convert to telephone number to E164
-        format.
+        format. The number is not parsed again, the result of the
+        validation is used.
+
+        @param element: Checked object (Field, FieldSet, etc.)
+        @type element: form.Element
+        """
+
+        element.setValue( self.getResult( element ) )
+
+    # unicode
+    def check( self, element ):
+
+        """
+        Checks the value is a valid telephone number or not.
 
         @param element: Checked object (Field, FieldSet, etc.)
         @type element: form.Element
+
+        @return: The telephone number in E164 format if it is valid
+        @rtype: unicode
         """
 
         prototype = parse( element.getValue(), element.getCountryCode() )
-        element.setValue( format_number( prototype, PhoneNumberFormat.E164 ) )
+        if not is_valid_number( prototype ):
+            return False
+
+        return format_number( prototype, PhoneNumberFormat.E164 )
+
+class Available( Validator ):
+
+    """
+    Checks the selected value (or values) is one of the field's options.
+    """
+
+    # Default error message if the validation fails
+    msg = u'Please select an available option.'
 
     # bool
     @invalidateOnError
     def isValid( self, element ):
 
         """
-        Checks the value is a valid telephone number or not.
+        Checks the selected value (or values) is one of the field's options.
 
-        @param element: Checked object (Field, FieldSet, etc.)
-        @type element: form.Element
+        @param element: Checked object (Select, Checkbox, etc.)
+        @type element: fields.Select
 
-        @return: The element's value is a telephone number
+        @return: The element's value is available
         @rtype: bool
         """
 
-        prototype = parse( element.getValue(), element.getCountryCode() )
-        return is_valid_number( prototype )
+        values = element.getValue() \
+            if element.isMultiple() \
+            else [ element.getValue() ]
+
+        for value in values:
+            option = element.getOption( value )
+            if option is None or option.isDisabled():
+                return False
+
+        return True
 
 class Range( Validator ):
 
@@ -403,6 +617,10 @@ class Range( Validator ):
 
         super( Range, self ).__init__( msg )
 
+        self._min_value = min_value
+        self._max_value = max_value
+        self._bounds = WeakKeyDictionary()
+
         validators = []
         if min_value is not None:
             validators.append( Greater( min_value, msg = min_msg ) )
@@ -425,6 +643,18 @@ class Range( Validator ):
         @rtype: bool
         """
 
+        try:
+            value = element.getValue()
+            min_value, max_value = self.getBounds( element )
+
+            if ( min_value is None or value >= min_value ) and \
+               ( max_value is None or value <= max_value ):
+                return True
+
+        except:
+            pass
+
+        # Use the comparators to create the same error message
         try:
             return self.validators.isValid( element )
 
@@ -434,6 +664,29 @@ class Range( Validator ):
 
             raise ValidationError( e.msg )
 
+    # tuple<type,type>
+    def getBounds( self, element ):
+
+        """
+        Returns the minimum and maximum values converted by the element's
+        type. They are converted only once per type, the results are
+        released with the type objects.
+
+        @param element: Checked object (Field, FieldSet, etc.)
+        @type element: form.Element
+
+        @return: Converted minimum and maximum values
+        @rtype: tuple<type,type>
+        """
+
+        try:
+            return self._bounds[ element.getType() ]
+
+        except KeyError:
+            return self._bounds.setdefault( element.getType(), tuple([ 
+                element.getTypeValue( value ) if value is not None else None \
+                for value in ( self._min_value, self._max_value ) ]) )
+
 class Length( Validator ):
 
     """
@@ -469,6 +722,9 @@ class Length( Validator ):
 
         super( Length, self ).__init__( msg )
 
+        self._min_length = int( min_length ) if min_length is not None else None
+        self._max_length = int( max_length ) if max_length is not None else None
+
         # int
         def getComparableValue( compare_object, element ):
 
@@ -541,6 +797,17 @@ class Length( Validator ):
         @rtype: bool
         """
 
+        try:
+            length = len( element.getValue() )
+
+            if ( self._min_length is None or length >= self._min_length ) and \
+               ( self._max_length is None or length <= self._max_length ):
+                return True
+
+        except:
+            pass
+
+        # Use the comparators to create the same error message
         try:
             return self.validators.isValid( element )
 
@@ -576,9 +843,9 @@ class Pattern( Validator ):
         """
 
         self.pattern = pattern
-        self._pattern = re.compile( self.pattern ) \
+        self._pattern = compilePattern( self.pattern ) \
             if not ignorecase \
-            else re.compile( pattern, re.I )
+            else compilePattern( pattern, re.I )
 
     # bool
     @invalidateOnError
@@ -629,7 +896,10 @@ class Selected( Length ):
         @type msg: unicode
         """
 
-        super( Selected, self ).__init__( msg )
+        super( Selected, self ).__init__( msg = msg )
+
+        self._min_length = int( min_selected ) if min_selected is not None else None
+        self._max_length = int( max_selected ) if max_selected is not None else None
 
         # int
         def getComparableValue( compare_object, element ):
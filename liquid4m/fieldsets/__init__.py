@@ -19,8 +19,7 @@ You should have received a copy of the GNU General Public License
 along with this program. If not, <see http://www.gnu.org/licenses/>.
 """
 
-import inspect
-from .. import widgets, form, exceptions, elements
+from .. import widgets, form, exceptions, elements, dialects
 from . import validators
 
 class FieldSet( elements.Element, elements.ElementCollector ):
@@ -53,20 +52,9 @@ class FieldSet( elements.Element, elements.ElementCollector ):
     # FieldSet
     def clone( self ):
 
-        clone_dict = self._init
-        clone_dict.update( self.getState().getState() )
-        clone_dict['name'] = self.getName()
-
-        init_args = set( list( 
-            inspect.getargspec( self.__class__.__init__ ).args 
-        ) )
-        init_args.remove('self')
-
-        fs = self.__class__(
-            **{ k:v for k,v in clone_dict.items() if k in init_args }
-        )
-
+        fs = super( FieldSet, self ).clone()
         fs._elements = []
+
         for element in self.getElements():
             clone = element.clone()
             fs._elements.append( clone )
@@ -79,8 +67,11 @@ class FieldSet( elements.Element, elements.ElementCollector ):
 
         super( FieldSet, self ).setAbsName( parent_abs_name )
 
-        for element in self.getElements():
-            element.setAbsName( self.getAbsName() )
+        abs_names = self._plan.getAbsNames( self.getAbsName() )
+        for element, abs_name in zip( self.getElements(), abs_names ):
+            element._abs_name = abs_name
+            if isinstance( element, FieldSet ):
+                element.setAbsName( self.getAbsName() )
 
     # dict
     def _getValue( self ):
@@ -110,7 +101,12 @@ class FieldSet( elements.Element, elements.ElementCollector ):
     # void
     def setValue( self, value_dict ):
 
-        self._setValue( form.flattenAbsData( value_dict ) )
+        # The request dialects are flat already, they are read directly
+        if isinstance( value_dict, dialects.MultiDictView ):
+            self._setValue( value_dict )
+            return
+
+        self._setValue( form.flattenAbsData( value_dict, self ) )
 
     # void
     def delValue( self ):
@@ -127,18 +123,64 @@ class FieldSet( elements.Element, elements.ElementCollector ):
     # void
     def validate( self ):
 
+        validators.run( self.iterValidate( inline = True ) )
+
+    # generator<validators.Task>
+    def iterValidate( self, executor = None, inline = False ):
+
         if not self.getState().isActive():
             return
 
-        errors = []
-        for element in self.getElements():
-            success, error = element.isValid()
-            errors += error
+        # Run the children's validation side by side. A step is resumed
+        # with the result of its last task (next is the same as send( None )
+        # and it is faster for the steps which are finished at once).
+        elements = self.getElements()
+        errors = [ () ] * len( elements )
+        running = [ ( i, element.iterValidate( executor, inline ), None, None ) \
+            for i, element in enumerate( elements ) ]
+
+        while running:
+            tasks = []
+            for i, step, value, error in running:
+                try:
+                    if error is not None:
+                        task = step.throw( error )
+
+                    elif value is None:
+                        task = next( step, None )
+
+                    else:
+                        task = step.send( value )
+
+                except StopIteration:
+                    continue
 
+                except exceptions.ValidationCollectionError as e:
+                    errors[i] = e.errors
+                    continue
+
+                except exceptions.ValidationError as e:
+                    errors[i] = [ ( elements[i].getName(), e.msg ) ]
+                    continue
+
+                if task is not None:
+                    tasks.append( ( i, step, task ) )
+
+            running = []
+            if tasks:
+                gathered = yield validators.Gather([ task for i, step, task in tasks ])
+                running = [ ( i, step, value, error ) \
+                    for ( i, step, task ), ( value, error ) in zip( tasks, gathered ) ]
+
+        errors = [ error for element_errors in errors for error in element_errors ]
         for validator in self.getValidators():
             try:
-                validator.validate( self )
-            
+                if not inline and isinstance( validator, validators.AsyncValidator ):
+                    validator.complete( self, ( yield validator.start( self ) ) )
+
+                else:
+                    validator.validate( self )
+
             except exceptions.ValidationError as e:
                 errors += [( self.getName(), e.msg )] 
 
@@ -157,3 +199,16 @@ class FieldSet( elements.Element, elements.ElementCollector ):
 
         except exceptions.ValidationError as e:
             return False, [ ( self.getName(), e.msg ) ]
+
+    # tuple<bool,list>
+    def isValidAsync( self, executor = None ):
+
+        try:
+            validators.run( self.iterValidate( executor ) )
+            return True, []
+
+        except exceptions.ValidationCollectionError as e:
+            return False, e.errors
+
+        except exceptions.ValidationError as e:
+            return False, [ ( self.getName(), e.msg ) ]
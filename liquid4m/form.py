@@ -19,33 +19,99 @@ You should have received a copy of the GNU General Public License
 along with this program. If not, <see http://www.gnu.org/licenses/>.
 """
 
-from . import widgets
+from . import widgets, elements, validators, exceptions
 
 # dict
-def flattenAbsData( value_dict ):
+def flattenAbsData( value_dict, element = None ):
 
     """
     Flat a multi-dimensional dictionary into one-dimensional dictionary.
-    The keys will be concenated automatically.
+    The keys will be concenated automatically. If the element is given, 
+    only the keys of its fields are kept and only the dictionaries of its
+    fieldsets are walked.
 
     @param value_dict: Multi-dimensional dictionary
     @type value_dict: dict
 
+    @param element: Schema aware mode's element (eg. FieldSet)
+    @type element: elements.ElementCollector
+
     @return: One-dimensional dictionary
     @type: dict
     """
 
+    fields = collectors = None
+    if element is not None:
+        abs_name = element.getAbsName()
+        fields = element._plan.getFieldPaths( abs_name )
+        collectors = element._plan.getCollectorNames( abs_name )
+        if abs_name is not None:
+            collectors = collectors | _getAbsNamePrefixes( abs_name )
+
     r_dict = {}
-    for key, value in ( value_dict or {} ).items():
-        if not isinstance( value, dict ):
-            r_dict[ key ] = value
+    stack = [ ( None, iter( ( value_dict or {} ).items() ) ) ]
+    while stack:
+        prefix, items = stack[-1]
+        for key, value in items:
+            abs_name = key \
+                if prefix is None \
+                else u'%s_%s' % ( prefix, key )
+
+            if isinstance( value, dict ):
+                if collectors is None or abs_name in collectors:
+                    stack.append( ( abs_name, iter( value.items() ) ) )
+                    break
+
+            elif fields is None or abs_name in fields:
+                r_dict[ abs_name ] = value
+
+        else:
+            stack.pop()
+
+    return r_dict
+
+# dict
+def nestAbsData( value_dict, element ):
+
+    """
+    Inverse of the flattenAbsData: create a multi-dimensional dictionary
+    (same as the element's value) from the one-dimensional dictionary. 
+    The names are splitted by the schema, the keys of not existing fields
+    are dropped.
+
+    @param value_dict: One-dimensional dictionary
+    @type value_dict: dict
+
+    @param element: Schema element (eg. FieldSet)
+    @type element: elements.ElementCollector
+
+    @return: Multi-dimensional dictionary
+    @type: dict
+    """
+
+    r_dict = {}
+    for abs_name, path in element._plan.getFieldPaths( element.getAbsName() ).items():
+        if abs_name not in value_dict:
             continue
 
-        for ikey, ivalue in flattenAbsData( value ).items():
-            r_dict[ u'{}_{}'.format( key, ikey ) ] = ivalue
+        parent = r_dict
+        for name in path[:-1]:
+            parent = parent.setdefault( name, {} )
+
+        parent[ path[-1] ] = value_dict[ abs_name ]
 
     return r_dict
 
+# set<unicode>
+def _getAbsNamePrefixes( abs_name ):
+
+    prefixes = set()
+    while abs_name:
+        prefixes.add( abs_name )
+        abs_name = abs_name.rpartition( '_' )[0]
+
+    return prefixes
+
 class Form( object ):
 
     """
@@ -54,7 +120,7 @@ class Form( object ):
 
     # void
     def __init__( self, element, value = None, submit = u'Submit', \
-                  buttons = None, cls = None ):
+                  buttons = None, cls = None, widget = None ):
 
         """
         Form class to render HTML forms by Liquid. It requires an Element
@@ -75,6 +141,10 @@ class Form( object ):
 
         @param cls: HTML class
         @type cls: unicode
+
+        @param widget: Widget of the form (e.g. widgets.FlatForm renders the
+            whole form in one template)
+        @type widget: widgets.Widget
         """
 
         # Clone the schema element
@@ -96,8 +166,11 @@ class Form( object ):
         ] + ( buttons or [] )
 
         # Define other variables
-        self._widget = widgets.Form()
+        self._widget = widget or widgets.Form()
         self._cls = cls
+        self._index = None
+        self._results = {}
+        self._dependencies = {}
         self.valid = None
 
     # elements.Element
@@ -153,6 +226,95 @@ class Form( object ):
 
         return self._element
 
+    # dict<unicode,elements.Element>
+    def getIndex( self ):
+
+        """
+        Returns the index of the form's elements by absolute name (eg.
+        'delivery_address_city') and by dotted path (eg. 
+        'delivery_address.city'). It is built on the first call.
+
+        @return: Elements by name
+        @rtype: dict<unicode,elements.Element>
+        """
+
+        if self._index is not None:
+            return self._index
+
+        index = {}
+        stack = [ ( self.getElement(), None ) ]
+        while stack:
+            element, path = stack.pop()
+            if path is not None:
+                index[ element.getAbsName() ] = element
+                index[ path ] = element
+
+            if isinstance( element, elements.ElementCollector ):
+                stack.extend( ( child, child.getName() \
+                    if path is None \
+                    else u'{}.{}'.format( path, child.getName() ) ) \
+                    for child in element.getElements() )
+
+        self._index = index
+        return index
+
+    # elements.Element
+    def getField( self, name ):
+
+        """
+        Returns the element by absolute name or dotted path.
+
+        @param name: Absolute name or dotted path of the element
+        @type name: unicode
+
+        @return: Element object
+        @rtype: elements.Element
+        """
+
+        try:
+            return self.getIndex()[ name ]
+
+        except KeyError:
+            return self.getElement().getField( name )
+
+    # void
+    def setValues( self, value_dict ):
+
+        """
+        Set the values of the given fields only, the other fields keep
+        their current values (eg. partial update from an AJAX request).
+        The keys are absolute names or dotted paths, the not existing ones
+        are skipped.
+
+        @param value_dict: New values of the fields
+        @type value_dict: dict
+        """
+
+        index = self.getIndex()
+        for name, value in flattenAbsData( value_dict ).items():
+            element = index.get( name )
+            if element is not None and not isinstance( element, elements.ElementCollector ):
+                element.setValue( value )
+
+    # void
+    def setErrors( self, errors ):
+
+        """
+        Set the error messages of the fields (eg. errors of a later, 
+        server side check). The names are absolute names or dotted paths,
+        the not existing ones are skipped.
+
+        @param errors: List of name and error message
+        @type errors: list<tuple<unicode,unicode>>
+        """
+
+        index = self.getIndex()
+        for name, msg in errors:
+            element = index.get( name )
+            if element is not None:
+                element.getState().setError( msg )
+                self.valid = False
+
     # unicode
     def getClass( self ):
 
@@ -185,6 +347,165 @@ class Form( object ):
         self.valid = valid
         return valid
 
+    # tuple<bool,list>
+    def isValidAsync( self, return_list = False, executor = None ):
+
+        """
+        Checks the validity of the form's basic element. The slow checks
+        (validators.AsyncValidator) of the different fields are running at
+        the same time, so the validation takes as long as the slowest check
+        instead of the sum of them. The result is the same as isValid's.
+
+        If an executor is given, every field is validated on it, so all of
+        the sibling fields (in the nested FieldSets too) are checked in 
+        parallel. The FieldSets' validators run after their children and
+        the order of the errors does not change.
+        
+        @param return_list: Returns list of error
+        @type return_list: bool
+
+        @param executor: Any object with a submit( fn, *args ) method
+            (eg. concurrent.futures.ThreadPoolExecutor)
+        @type executor: object
+
+        @return: Validity of the form
+        @rtype: bool (or tuple<bool,list<tuple<unicode,unicode>>>)
+        """
+
+        if return_list:
+            return self.getElement().isValidAsync( executor )
+
+        valid, _ = self.getElement().isValidAsync( executor )
+        self.valid = valid
+        return valid
+
+    # tuple<bool,list>
+    def revalidate( self, changed = None, return_list = False ):
+
+        """
+        Checks the validity of the form, but only the changed fields and the
+        FieldSet validators which depend on them (by their field_names and
+        position) are validated again. The results of the other validators
+        are reused from the previous call. The fields are changed if their
+        values were set since the previous call or they are listed in the
+        changed parameter. The first call validates every element, the 
+        result is the same as isValid's.
+
+        The changes of the elements' states (eg. required, disabled) are
+        not tracked, list the affected fields in the changed parameter.
+
+        @param changed: Absolute names or dotted paths of the changed fields
+            (the not existing ones are skipped)
+        @type changed: list<unicode>
+
+        @param return_list: Returns list of error
+        @type return_list: bool
+
+        @return: Validity of the form
+        @rtype: bool (or tuple<bool,list<tuple<unicode,unicode>>>)
+        """
+
+        index = self.getIndex()
+        names = { index[ name ].getAbsName() for name in changed or [] if name in index }
+
+        errors = self._revalidate( self.getElement(), names )
+        self.valid = len( errors ) == 0
+
+        if return_list:
+            return self.valid, errors
+
+        return self.valid
+
+    # list<tuple<unicode,unicode>>
+    def _revalidate( self, element, changed ):
+
+        if not element.getState().isActive():
+            return []
+
+        abs_name = element.getAbsName()
+        if not isinstance( element, elements.ElementCollector ):
+            if element.isDirty() or abs_name in changed or abs_name not in self._results:
+                if abs_name in self._results:
+                    element.getState().setError( None )
+
+                self._results[ abs_name ] = element.isValid()[1]
+                element.setDirty( False )
+                changed.add( abs_name )
+
+            return self._results[ abs_name ]
+
+        errors = []
+        for child in element.getElements():
+            errors += self._revalidate( child, changed )
+
+        dependencies, positions = self._getDependencies( element )
+        if abs_name in changed or abs_name not in self._results or \
+                not changed.isdisjoint( dependencies ):
+
+            # Restore the errors of the elements before the new validation
+            if abs_name in self._results:
+                element.getState().setError( None )
+                for position in positions:
+                    position_errors = self._results.get( position.getAbsName() )
+                    position.getState().setError( position_errors[-1][1] \
+                        if position_errors \
+                        else None )
+
+            results = []
+            for validator in element.getValidators():
+                try:
+                    validator.validate( element )
+
+                except exceptions.ValidationError as e:
+                    results += [( element.getName(), e.msg )] 
+
+            self._results[ abs_name ] = results
+            changed.add( abs_name )
+
+        return errors + self._results[ abs_name ]
+
+    # tuple<frozenset<unicode>,list<elements.Element>>
+    def _getDependencies( self, element ):
+
+        abs_name = element.getAbsName()
+        if abs_name in self._dependencies:
+            return self._dependencies[ abs_name ]
+
+        names, positions = set(), []
+        stack = list( element.getValidators() )
+        while stack:
+            validator = stack.pop()
+            if isinstance( validator, ( validators.And, validators.Or ) ):
+                stack.extend( validator.validators )
+
+            elif isinstance( validator, validators.FieldSetValidator ) and \
+                    validator.field_names:
+
+                names.update( validator.field_names )
+                if validator.position is not None:
+                    names.add( validator.position )
+                    positions.append( element.getField( validator.position ) )
+
+            else:
+
+                # Unknown dependencies: it depends on every child
+                names.update( element.getElementNames() )
+                if getattr( validator, 'position', None ) is not None:
+                    positions.append( element.getField( validator.position ) )
+
+        dependencies = set()
+        for name in names:
+            child = element.getField( name )
+            if isinstance( child, elements.ElementCollector ):
+                dependencies.add( child.getAbsName() )
+                dependencies.update( child._plan.getFieldPaths( child.getAbsName() ) )
+                dependencies.update( child._plan.getCollectorNames( child.getAbsName() ) )
+
+            else:
+                dependencies.add( child.getAbsName() )
+
+        return self._dependencies.setdefault( abs_name, ( frozenset( dependencies ), positions ) )
+
     # unicode
     def render( self ):
 
@@ -197,6 +518,34 @@ class Form( object ):
 
         return self._widget.render( self )
 
+    # generator<unicode>
+    def stream( self, buffer_size = 4096 ):
+
+        """
+        Render the form chunk by chunk. It could be returned as a WSGI
+        response body, so the server can start sending the HTML before the
+        last element is rendered.
+
+        @param buffer_size: Minimum length of the yielded chunks (0 disables
+            the buffering)
+        @type buffer_size: int
+
+        @return: HTML chunks
+        @rtype: generator<unicode>
+        """
+
+        buf, length = [], 0
+        for chunk in self._widget.generate( self ):
+            buf.append( chunk )
+            length += len( chunk )
+
+            if length >= buffer_size:
+                yield u''.join( buf )
+                buf, length = [], 0
+
+        if buf:
+            yield u''.join( buf )
+
     # dict
     def getValue( self ):
 
@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+
+"""
+Liquid is a form management tool for web frameworks.
+Copyright (C) 2014, Bence Faludi (b.faludi@mito.hu)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, <see http://www.gnu.org/licenses/>.
+"""
+
+
+import json, threading
+from . import form, elements, exceptions
+from .cache import LRUCache
+
+class LiveValidator( object ):
+
+    """
+    Validate one field at a time (eg. inline AJAX checks while the user is
+    typing). The form is created only once, only the checked field's 
+    validators (and the Required check) are running and the results of 
+    the recently checked values are cached. The FieldSet validators are 
+    not checked, they need the whole form.
+    """
+
+    # Error message of the not convertible values
+    conversion_msg = u'Please enter a valid value.'
+
+    # Error message of the not existing fields
+    unknown_msg = u'Unknown field.'
+
+    # void
+    def __init__( self, schema, cache_size = 1024, cache_ttl = 300 ):
+
+        """
+        Validate one field at a time.
+
+        @param schema: Schema element object
+        @type schema: elements.Element
+
+        @param cache_size: Number of cached results
+        @type cache_size: int
+
+        @param cache_ttl: Lifetime of the cached results in seconds, the
+            validators could depend on changing data (eg. taken usernames)
+        @type cache_ttl: float
+        """
+
+        self._form = form.Form( schema )
+        self._snapshots = {}
+        self._lock = threading.Lock()
+        self._cache = LRUCache( max_size = cache_size, ttl = cache_ttl )
+
+    # form.Form
+    def getForm( self ):
+
+        """
+        Returns the reused form.
+
+        @return: Form object
+        @rtype: form.Form
+        """
+
+        return self._form
+
+    # cache.LRUCache
+    def getCache( self ):
+
+        """
+        Returns the cache of the results.
+
+        @return: Cache object
+        @rtype: cache.LRUCache
+        """
+
+        return self._cache
+
+    # dict
+    def validate( self, name, value ):
+
+        """
+        Validate the value of the field. If the form has no field with the
+        given name the result is invalid with the unknown_msg error.
+
+        @param name: Absolute name or dotted path of the field
+        @type name: unicode
+
+        @param value: Value of the field (as it is sent by the browser)
+        @type value: type
+
+        @return: Absolute name, validity and the error message
+        @rtype: dict
+        """
+
+        field = self._form.getIndex().get( name )
+        if field is None or isinstance( field, elements.ElementCollector ):
+            return {
+                'name': name,
+                'valid': False,
+                'error': self.unknown_msg
+            }
+
+        key = ( field.getAbsName(), type( value ).__name__, tuple( value ) \
+            if isinstance( value, list ) \
+            else value )
+
+        try:
+            result = self._cache.get( key )
+
+        except TypeError:
+            key, result = None, None
+
+        if result is not None:
+            return dict( result )
+
+        result = {
+            'name': field.getAbsName(),
+            'valid': True,
+            'error': None
+        }
+
+        with self._lock:
+            state = field.getState()
+            state.restoreSnapshot( self._snapshots.setdefault( 
+                field.getAbsName(), state.getSnapshot() ) )
+
+            try:
+                field.setValue( value )
+                field.validate()
+
+            except exceptions.TypeConversionError:
+                result.update( valid = False, error = self.conversion_msg )
+
+            except exceptions.ValidationError as e:
+                result.update( valid = False, error = e.msg )
+
+        if key is not None:
+            self._cache.set( key, result )
+
+        return dict( result )
+
+    # unicode
+    def validateJSON( self, name, value ):
+
+        """
+        Validate the value of the field and returns the result in JSON.
+
+        @param name: Absolute name or dotted path of the field
+        @type name: unicode
+
+        @param value: Value of the field (as it is sent by the browser)
+        @type value: type
+
+        @return: JSON object with name, valid and error keys
+        @rtype: unicode
+        """
+
+        return json.dumps( self.validate( name, value ) )
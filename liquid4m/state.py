@@ -19,13 +19,26 @@ You should have received a copy of the GNU General Public License
 along with this program. If not, <see http://www.gnu.org/licenses/>.
 """
 
+# Flags of the State
+REQUIRED = 1
+HIDDEN = 2
+READONLY = 4
+DISABLED = 8
+FOCUS = 16
+
+# Inactive elements are not validated
+INACTIVE = HIDDEN | READONLY | DISABLED
+
 class State( object ):
 
     """
     State object of given element. It knows the element is visible or
-    required, or maybe in disabled status, etc.
+    required, or maybe in disabled status, etc. The boolean properties are
+    stored in a single integer to keep the object small.
     """
 
+    __slots__ = ( 'flags', 'error' )
+
     # void
     def __init__( self, required, hidden, readonly, disabled, focus, error = None ):
 
@@ -52,12 +65,51 @@ class State( object ):
         @type error: unicode
         """
 
-        self.setError( error )
-        self.setRequired( required )
-        self.setHidden( hidden )
-        self.setReadonly( readonly )
-        self.setDisabled( disabled )
-        self.setFocus( focus )
+        self.error = error
+        self.flags = ( REQUIRED if required else 0 ) \
+            | ( HIDDEN if hidden else 0 ) \
+            | ( READONLY if readonly else 0 ) \
+            | ( DISABLED if disabled else 0 ) \
+            | ( FOCUS if focus else 0 )
+
+    # State
+    def copy( self ):
+
+        """
+        Returns a new State object with the same state.
+
+        @return: Copy of the state
+        @rtype: state.State
+        """
+
+        clone = State.__new__( State )
+        clone.flags, clone.error = self.flags, self.error
+        return clone
+
+    # tuple<int,unicode>
+    def getSnapshot( self ):
+
+        """
+        Returns the current state in a compact form which could be
+        restored by restoreSnapshot().
+
+        @return: Flags and error message
+        @rtype: tuple<int,unicode>
+        """
+
+        return self.flags, self.error
+
+    # void
+    def restoreSnapshot( self, snapshot ):
+
+        """
+        Restore the state from a snapshot created by getSnapshot().
+
+        @param snapshot: Flags and error message
+        @type snapshot: tuple<int,unicode>
+        """
+
+        self.flags, self.error = snapshot
 
     # dict
     def getState( self ):
@@ -78,6 +130,25 @@ class State( object ):
             'error': self.getError()
         }
 
+    # void
+    def setFlag( self, flag, value = True ):
+
+        """
+        Set or unset the given flag.
+
+        @param flag: Flag (REQUIRED, HIDDEN, READONLY, DISABLED, FOCUS)
+        @type flag: int
+
+        @param value: New value of the flag
+        @type value: bool
+        """
+
+        if value:
+            self.flags |= flag
+
+        else:
+            self.flags &= ~flag
+
     # void
     def setError( self, error ):
 
@@ -91,7 +162,7 @@ class State( object ):
 
         self.error = error
 
-     # void
+    # void
     def setRequired( self, required = True ):
 
         """
@@ -101,7 +172,7 @@ class State( object ):
         @type required: bool
         """
 
-        self.required = required
+        self.setFlag( REQUIRED, required )
 
     # void
     def setFocus( self, focus = True ):
@@ -113,7 +184,7 @@ class State( object ):
         @type focus: bool
         """
 
-        self.focus = focus
+        self.setFlag( FOCUS, focus )
 
     # void
     def setHidden( self, hidden = True ):
@@ -125,7 +196,7 @@ class State( object ):
         @type hidden: bool
         """
 
-        self.hidden = hidden
+        self.setFlag( HIDDEN, hidden )
 
     # void
     def setReadonly( self, readonly = True ):
@@ -137,7 +208,7 @@ class State( object ):
         @type readonly: bool
         """
 
-        self.readonly = readonly
+        self.setFlag( READONLY, readonly )
 
     # void
     def setDisabled( self, disabled = True ):
@@ -149,7 +220,7 @@ class State( object ):
         @type disabled: bool
         """
 
-        self.disabled = disabled
+        self.setFlag( DISABLED, disabled )
 
     # bool
     def isError( self ):
@@ -173,7 +244,7 @@ class State( object ):
         @rtype: bool
         """
 
-        return self.required
+        return bool( self.flags & REQUIRED )
 
     # bool
     def isFocus( self ):
@@ -185,7 +256,7 @@ class State( object ):
         @rtype: bool
         """
 
-        return self.focus
+        return bool( self.flags & FOCUS )
 
     # bool
     def isHidden( self ):
@@ -197,7 +268,7 @@ class State( object ):
         @rtype: bool
         """
 
-        return self.hidden
+        return bool( self.flags & HIDDEN )
 
     # bool
     def isReadonly( self ):
@@ -209,7 +280,7 @@ class State( object ):
         @rtype: bool
         """
 
-        return self.readonly
+        return bool( self.flags & READONLY )
 
     # bool
     def isDisabled( self ):
@@ -221,7 +292,7 @@ class State( object ):
         @rtype: bool
         """
 
-        return self.disabled
+        return bool( self.flags & DISABLED )
 
     # bool
     def isActive( self ):
@@ -234,10 +305,7 @@ class State( object ):
         @rtype: bool
         """
 
-        if self.isHidden() or self.isReadonly() or self.isDisabled():
-            return False
-
-        return True
+        return not self.flags & INACTIVE
 
     # unicode
     def getError( self ):
@@ -19,4 +19,563 @@ You should have received a copy of the GNU General Public License
 along with this program. If not, <see http://www.gnu.org/licenses/>.
 """
 
-pass
+import time, threading, unittest
+from . import fields, fieldsets, form, validators, widgets, batch, live
+from .fields.options import Option, OptionGroup, SearchIndex
+from .cache import LRUCache
+
+class Slow( validators.AsyncValidator ):
+
+    msg = u'%(value)s is taken'
+
+    # bool
+    def isValid( self, element ):
+
+        self.thread = threading.current_thread()
+        time.sleep( 0.05 )
+        return element.getValue() != u'admin'
+
+class Broken( validators.AsyncValidator ):
+
+    msg = u'Broken'
+
+    # bool
+    def isValid( self, element ):
+
+        raise validators.ValidationError( u'Service is not available' )
+
+class SlowPair( validators.AsyncValidator, validators.FieldSetValidator ):
+
+    msg = u'Same values'
+
+    # bool
+    def isValid( self, fieldset ):
+
+        time.sleep( 0.05 )
+        return fieldset.a.getValue() != fieldset.b.getValue()
+
+class Executor( object ):
+
+    """
+    Executor with the interface of concurrent.futures.ThreadPoolExecutor.
+    """
+
+    # void
+    def __init__( self ):
+
+        self.submitted = []
+
+    # validators.Task
+    def submit( self, fn, *args ):
+
+        self.submitted.append( fn )
+        return validators.Task( fn, *args )
+
+class Inner( fieldsets.FieldSet ):
+
+    x = fields.Text( validators = validators.And(
+        fields.validators.Length( 2 ),
+        Slow(),
+        fields.validators.Length( max_length = 6 )
+    ) )
+    y = fields.Text( required = True, validators = Slow() )
+
+class Schema( fieldsets.FieldSet ):
+
+    _default_validators = SlowPair( position = 'a' )
+
+    a = fields.Text( validators = Slow() )
+    b = fields.Text( validators = [ Slow(), Broken() ] )
+    inner = Inner()
+
+DATA = [
+    { 'a': u'admin', 'b': u'admin', 'inner_x': u'admin', 'inner_y': None },
+    { 'a': u'x1', 'b': u'x2', 'inner_x': u'abcdefgh', 'inner_y': u'q' },
+    { 'a': u'x1', 'b': u'x1', 'inner_x': u'a', 'inner_y': u'admin' }
+]
+
+class TaskTest( unittest.TestCase ):
+
+    # void
+    def testResult( self ):
+
+        task = validators.Task( lambda a, b: a + b, 1, 2 )
+        self.assertEqual( task.result(), 3 )
+
+    # void
+    def testError( self ):
+
+        task = validators.Task( lambda: 1 / 0 )
+        self.assertRaises( ZeroDivisionError, task.result )
+
+    # void
+    def testGatherOrder( self ):
+
+        # The first task finishes last, the results keep the given order
+        def wait( seconds, value ):
+
+            time.sleep( seconds )
+            return value
+
+        gather = validators.Gather([
+            validators.Task( wait, 0.1, 'first' ),
+            validators.Task( lambda: 1 / 0 ),
+            validators.Task( wait, 0, 'third' )
+        ])
+        results = gather.result()
+
+        self.assertEqual( [ value for value, error in results ], [ 'first', None, 'third' ] )
+        self.assertEqual( [ type( error ) for value, error in results ], \
+            [ type( None ), ZeroDivisionError, type( None ) ] )
+
+class ValidationTest( unittest.TestCase ):
+
+    # void
+    def testSameResult( self ):
+
+        for data in DATA:
+            expected = form.Form( Schema(), data ).isValid( True )
+
+            self.assertEqual( form.Form( Schema(), data ).isValidAsync( True ), expected )
+            self.assertEqual( form.Form( Schema(), data ).revalidate( return_list = True ), expected )
+
+    # void
+    def testErrorPropagation( self ):
+
+        valid, errors = form.Form( Schema(), DATA[1] ).isValidAsync( True )
+
+        self.assertFalse( valid )
+        self.assertEqual( errors, [
+            ( 'b', u'Service is not available' ),
+            ( 'x', u'Length must be less then or equal to 6.' )
+        ] )
+
+    # void
+    def testParallel( self ):
+
+        # 5 checks of 0.05 seconds are running at the same time, then the
+        # fieldset's check after them
+        f = form.Form( Schema(), DATA[2] )
+        start = time.time()
+        f.isValidAsync()
+
+        self.assertLess( time.time() - start, 0.2 )
+
+    # void
+    def testInline( self ):
+
+        # The normal validation runs the checks in the caller's thread
+        f = form.Form( Schema(), DATA[2] )
+        f.isValid()
+
+        validator = f.getElement().a.getValidators()[0]
+        self.assertIs( validator.thread, threading.current_thread() )
+
+    # void
+    def testExecutor( self ):
+
+        for data in DATA:
+            executor = Executor()
+            f = form.Form( Schema(), data )
+            result = f.isValidAsync( True, executor = executor )
+
+            self.assertEqual( result, form.Form( Schema(), data ).isValid( True ) )
+            self.assertEqual( len( executor.submitted ), 4 )
+
+class Choices( fieldsets.FieldSet ):
+
+    color = fields.Select( options = [
+        Option( u'r', u'Red' ),
+        OptionGroup( u'Other', options = [
+            Option( u'g', u'Green' ),
+            Option( u'b', u'Blue' )
+        ] )
+    ] )
+    sizes = fields.Checkbox( options = [
+        Option( u's', u'Small' ),
+        Option( u'm', u'Medium' ),
+        Option( u'l', u'Large' )
+    ] )
+
+class RenderCacheTest( unittest.TestCase ):
+
+    # void
+    def testSelection( self ):
+
+        # The cached markup is patched with the selection of every form
+        for color, sizes in ( ( u'g', [] ), ( u'r', [ u's', u'l' ] ), ( None, [ u'm' ] ) ):
+            f = form.Form( Choices(), { 'color': color, 'sizes': sizes } )
+            for field in ( f.getField( 'color' ), f.getField( 'sizes' ) ):
+                self.assertTrue( field.hasStaticOptions() )
+                self.assertEqual( field.renderOptions(), \
+                    widgets.Options( field ).render( field.getOptions() ) )
+
+    # void
+    def testID( self ):
+
+        # The forms of the same schema share the cache, but not their IDs
+        schema = Choices()
+        first, second = form.Form( schema ).getField( 'sizes' ), form.Form( schema ).getField( 'sizes' )
+
+        self.assertNotEqual( first.getID(), second.getID() )
+        self.assertIn( first.getID() + u'__s', first.renderOptions() )
+        self.assertIn( second.getID() + u'__s', second.renderOptions() )
+        self.assertNotIn( first.getID() + u'__', second.renderOptions() )
+        self.assertEqual( len( first._options.getRenderCache() ), 1 )
+
+    # void
+    def testDynamic( self ):
+
+        # The options of a function based group are not cached
+        select = fields.Select( options = [
+            Option( u'r', u'Red' ),
+            OptionGroup( u'Other', options = lambda: [ Option( u'g', u'Green' ) ] )
+        ] )
+
+        self.assertFalse( select.hasStaticOptions() )
+
+class MaxLength( fields.validators.MemoizedValidator ):
+
+    msg = u'Too long'
+
+    # Own cache, the results of the other tests are not mixed in
+    cache = LRUCache( max_size = 16 )
+
+    # void
+    def __init__( self, limit, msg = None ):
+
+        super( MaxLength, self ).__init__( msg )
+
+        self.limit = limit
+        self._calls = 0
+
+    # bool
+    def check( self, element ):
+
+        self._calls += 1
+        return len( element.getValue() ) <= self.limit
+
+class MemoizedValidatorTest( unittest.TestCase ):
+
+    # void
+    def testConfigKey( self ):
+
+        # The validators of the same class with different settings do not
+        # share their results
+        field = fields.Text( value = u'abcd' )
+        strict, loose = MaxLength( 2 ), MaxLength( 6 )
+
+        self.assertFalse( strict.isValid( field ) )
+        self.assertTrue( loose.isValid( field ) )
+        self.assertNotEqual( strict.getCacheKey( field ), loose.getCacheKey( field ) )
+
+    # void
+    def testReuse( self ):
+
+        # The same settings (the message is not a part of them) share the
+        # result, it is calculated only once
+        field = fields.Text( value = u'abcdefgh' )
+        first, second = MaxLength( 3 ), MaxLength( 3, msg = u'Other message' )
+
+        self.assertFalse( first.isValid( field ) )
+        self.assertFalse( first.isValid( field ) )
+        self.assertFalse( second.isValid( field ) )
+        self.assertEqual( ( first._calls, second._calls ), ( 1, 0 ) )
+
+class Record( fieldsets.FieldSet ):
+
+    name = fields.Text( required = True )
+    age = fields.Number( validators = fields.validators.Range( 0, 120 ) )
+
+ROWS = [
+    { 'name': u'Alice', 'age': u'30' },
+    { 'name': None, 'age': u'x' },
+    { 'name': u'Bob', 'age': u'130' },
+    { 'age': u'5' },
+    { 'name': u'Carol', 'age': None }
+] * 3
+
+class BatchTest( unittest.TestCase ):
+
+    # void
+    def testSameErrors( self ):
+
+        # Every row is validated on its own, the errors of the convertible
+        # rows are the same as a new form's
+        results = list( batch.validateMany( Record(), ROWS, chunk_size = 4 ) )
+
+        self.assertEqual( [ index for index, value, errors in results ], range( len( ROWS ) ) )
+        for ( index, value, errors ), row in zip( results, ROWS ):
+            if index % 5 == 1:
+                self.assertEqual( errors, [ ( 'age', batch.BatchValidator.conversion_msg ) ] )
+                continue
+
+            f = form.Form( Record(), row )
+            self.assertEqual( ( len( errors ) == 0, errors ), f.isValid( True ) )
+            self.assertEqual( value, f.getValue() )
+
+    # void
+    def testSharded( self ):
+
+        # The workers return the same results in the original order
+        expected = list( batch.validateMany( Record(), ROWS ) )
+        validator = batch.ShardedValidator( batch.SchemaReference( Record ), \
+            processes = 2, chunk_size = 2, max_pending = 2 )
+
+        self.assertEqual( list( validator.validate( iter( ROWS ) ) ), expected )
+
+        statistics = validator.getStatistics()
+        self.assertEqual( statistics.getRows(), len( ROWS ) )
+        self.assertEqual( statistics.getInvalidRows(), 9 )
+        self.assertEqual( statistics.getErrors()[ ( 'age', batch.BatchValidator.conversion_msg ) ], 3 )
+        self.assertEqual( sum( statistics.getErrors().values() ), 9 )
+
+class Deep( fieldsets.FieldSet ):
+
+    c = fields.Text()
+    outer = Schema()
+
+class AbsDataTest( unittest.TestCase ):
+
+    # void
+    def testRoundTrip( self ):
+
+        # The nested value of the form is restored from the flat one
+        value = {
+            'c': u'c',
+            'outer': { 'a': u'a', 'b': None, 'inner': { 'x': u'x', 'y': u'y' } }
+        }
+        element = form.Form( Deep() ).getElement()
+        flat = form.flattenAbsData( value, element )
+
+        self.assertEqual( flat, {
+            'c': u'c', 'outer_a': u'a', 'outer_b': None,
+            'outer_inner_x': u'x', 'outer_inner_y': u'y'
+        } )
+        self.assertEqual( form.nestAbsData( flat, element ), value )
+        self.assertEqual( form.Form( Deep(), flat ).getValue(), value )
+
+    # void
+    def testUnknownKeys( self ):
+
+        # The schema aware mode drops the keys of the not existing fields
+        # and does not walk the dictionaries of the fields
+        value = { 'c': { 'd': 1 }, 'z': 2, 'outer': { 'inner': { 'x': 3, 'q': 4 } } }
+        element = form.Form( Deep() ).getElement()
+
+        self.assertEqual( form.flattenAbsData( value, element ), { 'outer_inner_x': 3 } )
+        self.assertEqual( form.flattenAbsData( value ), \
+            { 'c_d': 1, 'z': 2, 'outer_inner_x': 3, 'outer_inner_q': 4 } )
+        self.assertEqual( form.nestAbsData( { 'outer_inner_x': 3, 'outer_q': 4 }, element ), \
+            { 'outer': { 'inner': { 'x': 3 } } } )
+
+class Counted( validators.Validator ):
+
+    msg = u'Invalid value'
+
+    # Number of checks by element's name
+    calls = {}
+
+    # bool
+    def isValid( self, element ):
+
+        Counted.calls[ element.getName() ] = Counted.calls.get( element.getName(), 0 ) + 1
+        return element.getValue() != u'bad'
+
+class Account( fieldsets.FieldSet ):
+
+    _default_validators = fieldsets.validators.Same( 
+        position = 'confirm', 
+        field_names = [ 'password', 'confirm' ]
+    )
+
+    email = fields.Text( required = True, validators = Counted() )
+    password = fields.Text( label = u'Password', validators = Counted() )
+    confirm = fields.Text( label = u'Confirm' )
+    profile = type( 'Profile', ( fieldsets.FieldSet, ), {
+        'nick': fields.Text( validators = Counted() )
+    } )()
+
+UPDATES = [
+    { 'email': u'a@b.c', 'password': u'x', 'confirm': u'x', 'profile': { 'nick': u'n' } },
+    { 'confirm': u'y' },
+    { 'profile_nick': u'bad' },
+    { 'email': None, 'confirm': u'x' },
+    { 'password': u'bad', 'profile': { 'nick': u'ok' } },
+    { 'email': u'bad', 'password': u'x' }
+]
+
+class RevalidateTest( unittest.TestCase ):
+
+    # void
+    def testSameAsFullValidation( self ):
+
+        # After every partial update the result and the error states are
+        # the same as a full validation's
+        f = form.Form( Account() )
+        data = {}
+        for update in UPDATES:
+            f.setValues( update )
+            data.update( form.flattenAbsData( update ) )
+
+            expected = form.Form( Account(), data )
+            self.assertEqual( f.revalidate( return_list = True ), expected.isValid( True ) )
+
+            index = expected.getIndex()
+            for name, element in f.getIndex().items():
+                self.assertEqual( element.getState().getError(), \
+                    index[ name ].getState().getError() )
+
+    # void
+    def testChangedOnly( self ):
+
+        # Only the changed field's validators are running again
+        f = form.Form( Account(), UPDATES[0] )
+        f.revalidate()
+        Counted.calls.clear()
+
+        f.setValues({ 'confirm': u'y' })
+        f.revalidate()
+        self.assertEqual( Counted.calls, {} )
+
+        f.setValues({ 'profile.nick': u'bad' })
+        self.assertFalse( f.revalidate() )
+        self.assertEqual( Counted.calls, { 'nick': 1 } )
+
+        self.assertFalse( f.revalidate( changed = [ 'email' ] ) )
+        self.assertEqual( Counted.calls, { 'nick': 1, 'email': 1 } )
+
+class Taken( validators.Validator ):
+
+    msg = u'%(value)s is taken'
+
+    # Taken usernames (changed by the tests)
+    names = set()
+
+    # Number of checks
+    calls = 0
+
+    # bool
+    def isValid( self, element ):
+
+        Taken.calls += 1
+        return element.getValue() not in Taken.names
+
+class Signup( fieldsets.FieldSet ):
+
+    username = fields.Text( required = True, validators = Taken() )
+    age = fields.Number()
+    profile = type( 'Profile', ( fieldsets.FieldSet, ), {
+        'nick': fields.Text( validators = Counted() )
+    } )()
+
+class LiveValidatorTest( unittest.TestCase ):
+
+    # void
+    def setUp( self ):
+
+        Taken.names = { u'admin' }
+        Taken.calls = 0
+
+    # void
+    def testSameAsForm( self ):
+
+        # The result is the same as the field's error in a full validation,
+        # the previous checks do not affect the next ones
+        checker = live.LiveValidator( Signup() )
+        for name, value in ( ( 'username', u'admin' ), ( 'username', None ), \
+                ( 'username', u'bob' ), ( 'profile.nick', u'bad' ), ( 'profile_nick', u'ok' ) ):
+
+            f = form.Form( Signup(), { 'username': u'x', 'profile': { 'nick': u'x' } } )
+            f.setValues({ name: value })
+            f.isValid()
+
+            self.assertEqual( checker.validate( name, value ), {
+                'name': f.getField( name ).getAbsName(),
+                'valid': f.getField( name ).getState().getError() is None,
+                'error': f.getField( name ).getState().getError()
+            } )
+
+    # void
+    def testRecheck( self ):
+
+        # The cached result is reused until it expires, then the changed
+        # data is checked again
+        checker = live.LiveValidator( Signup(), cache_ttl = 0.05 )
+
+        self.assertTrue( checker.validate( 'username', u'bob' )['valid'] )
+        Taken.names.add( u'bob' )
+        self.assertTrue( checker.validate( 'username', u'bob' )['valid'] )
+        self.assertEqual( Taken.calls, 1 )
+
+        time.sleep( 0.1 )
+        self.assertEqual( checker.validate( 'username', u'bob' )['error'], u'bob is taken' )
+        self.assertEqual( Taken.calls, 2 )
+
+    # void
+    def testInvalidInput( self ):
+
+        checker = live.LiveValidator( Signup() )
+
+        self.assertEqual( checker.validate( 'age', u'x' )['error'], checker.conversion_msg )
+        self.assertEqual( checker.validate( 'profile', u'x' )['error'], checker.unknown_msg )
+        self.assertEqual( checker.validate( 'missing', u'x' )['error'], checker.unknown_msg )
+        self.assertTrue( checker.validate( 'age', u'12' )['valid'] )
+
+class SearchTest( unittest.TestCase ):
+
+    # void
+    def testOrder( self ):
+
+        # The labels starting with the query come first, the others keep
+        # the original order, the disabled options are not indexed
+        index = SearchIndex([
+            Option( u'1', u'Banana split' ),
+            Option( u'2', u'Pineapple' ),
+            Option( u'3', u'Apple' ),
+            OptionGroup( u'Pies', options = [
+                Option( u'4', u'Crab apple pie' ),
+                Option( u'5', u'Apple pie' ),
+                Option( u'6', u'Apple crumble', disabled = True )
+            ] ),
+            OptionGroup( u'Other', disabled = True, options = [
+                Option( u'7', u'Apple juice' )
+            ] )
+        ])
+
+        search = lambda query: [ option.getLabel() for option in index.search( query ) ]
+
+        self.assertEqual( len( index ), 5 )
+        self.assertEqual( search( u'apple' ), [ u'Apple', u'Apple pie', u'Pineapple', u'Crab apple pie' ] )
+        self.assertEqual( search( u'AP' ), [ u'Apple', u'Apple pie', u'Crab apple pie' ] )
+        self.assertEqual( search( u'e pi' ), [ u'Crab apple pie', u'Apple pie' ] )
+        self.assertEqual( search( u'kiwi' ), [] )
+
+    # void
+    def testPaging( self ):
+
+        field = fields.Autocomplete( 
+            min_search_length = 2,
+            options = [ Option( unicode( i ), u'Item %03d' % i ) for i in range( 250 ) ]
+        )
+        ids = lambda result: [ option['id'] for option in result['results'] ]
+
+        self.assertEqual( field.search( u' i ' ), { 'results': [], 'more': False } )
+        self.assertEqual( ids( field.search( u'item', 2, 10 ) ), map( unicode, range( 10, 20 ) ) )
+        self.assertTrue( field.search( u'item', 2, 10 )['more'] )
+
+        # The page size is limited, the invalid parameters are replaced
+        result = field.search( u'item', 1, 1000 )
+        self.assertEqual( len( result['results'] ), field.max_per_page )
+        self.assertTrue( result['more'] )
+
+        result = field.search( u'item', 3, 1000 )
+        self.assertEqual( ids( result ), map( unicode, range( 200, 250 ) ) )
+        self.assertFalse( result['more'] )
+
+        self.assertEqual( len( field.search( u'item', u'x', u'y' )['results'] ), field.default_per_page )
+        self.assertEqual( field.search( u'item', -5, 0 )['results'][0]['id'], u'0' )
+        self.assertEqual( len( field.search( u'item', -5, 0 )['results'] ), 1 )
+
+if __name__ == '__main__':
+    unittest.main()
@@ -19,6 +19,7 @@ You should have received a copy of the GNU General Public License
 along with this program. If not, <see http://www.gnu.org/licenses/>.
 """
 
+import threading
 from .exceptions import ValidationError
 from functools import wraps
 
@@ -49,6 +50,149 @@ def invalidateOnError( func ):
 
     return wrapper
 
+# list<validators.Validator>
+def compilePlan( validator_list ):
+
+    """
+    Compile the list of validators into a flat validation plan. The nested
+    And validators are unfolded, because raising the first error of the
+    children is the same as checking them one after the other.
+
+    @param validator_list: List of validator objects
+    @type validator_list: list<validators.Validator>
+
+    @return: Flat list of validator objects
+    @rtype: list<validators.Validator>
+    """
+
+    plan = []
+    for validator in validator_list:
+        if type( validator ) is And:
+            plan += compilePlan( validator.validators )
+
+        else:
+            plan.append( validator )
+
+    return plan
+
+# void
+def run( steps ):
+
+    """
+    Drive a validation generator (see iterValidate methods). The generator
+    yields the handles of the started checks and gets back their results,
+    so the checks of different elements are running at the same time.
+
+    @param steps: Validation generator
+    @type steps: generator<validators.Task>
+    """
+
+    value, error = None, None
+    while True:
+        try:
+            task = steps.send( value ) \
+                if error is None \
+                else steps.throw( error )
+
+        except StopIteration:
+            return
+
+        try:
+            value, error = task.result(), None
+
+        except Exception as e:
+            value, error = None, e
+
+class Task( object ):
+
+    """
+    Handle of a function which is running in a background thread. It has
+    the same result() method as the concurrent.futures.Future objects.
+    """
+
+    # void
+    def __init__( self, fn, *args ):
+
+        """
+        Handle of a function which is running in a background thread.
+
+        @param fn: Called function
+        @type fn: func
+
+        @param args: Arguments of the function
+        @type args: list
+        """
+
+        self._result, self._error = None, None
+        self._thread = threading.Thread( target = self._run, args = ( fn, args ) )
+        self._thread.daemon = True
+        self._thread.start()
+
+    # void
+    def _run( self, fn, args ):
+
+        try:
+            self._result = fn( *args )
+
+        except Exception as e:
+            self._error = e
+
+    # type
+    def result( self ):
+
+        """
+        Wait for the function and returns its result. If the function
+        raised an exception it will be raised again.
+
+        @return: Result of the function
+        @rtype: type
+        """
+
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+        return self._result
+
+class Gather( object ):
+
+    """
+    Handle of more running functions.
+    """
+
+    # void
+    def __init__( self, tasks ):
+
+        """
+        Handle of more running functions.
+
+        @param tasks: List of handles
+        @type tasks: list<validators.Task>
+        """
+
+        self._tasks = tasks
+
+    # list<tuple<type,Exception>>
+    def result( self ):
+
+        """
+        Wait for all functions and returns their results and exceptions in
+        the same order.
+
+        @return: List of results and exceptions
+        @rtype: list<tuple<type,Exception>>
+        """
+
+        results = []
+        for task in self._tasks:
+            try:
+                results.append( ( task.result(), None ) )
+
+            except Exception as e:
+                results.append( ( None, e ) )
+
+        return results
+
 class Validator( object ):
 
     """
@@ -88,6 +232,29 @@ class Validator( object ):
 
         return {}
 
+    # dict
+    def getStaticData( self ):
+
+        """
+        Returns the validator's attributes for the error message. They are
+        formatted on the first failure and reused while the attributes are
+        not changed (eg. a validator could store the checked value in
+        isValid).
+
+        @return: Formatted attributes of the validator
+        @rtype: dict
+        """
+
+        attrs = { k: v for k, v in self.__dict__.items() if k != '_static_data' }
+        cached = self.__dict__.get( '_static_data' )
+        if cached is not None and cached[0] == attrs:
+            return cached[1]
+
+        data = { k: ( unicode( v ) if v is not None else u'-' ) \
+            for k, v in attrs.items() }
+        self.__dict__['_static_data'] = ( attrs, data )
+        return data
+
     # unicode
     def getMessage( self, element ):
 
@@ -102,7 +269,7 @@ class Validator( object ):
         @rtype: unicode
         """
 
-        rdict = { k : ( unicode(v) if v is not None else u'-' ) for k,v in self.__dict__.items() }
+        rdict = dict( self.getStaticData() )
         rdict.update({
             'name': element.getName(),
             'label': element.getLabel(),
@@ -161,12 +328,62 @@ class Validator( object ):
         @type element: form.Element
         """
 
-        if not self.isValid( element ):
+        self.complete( element, self.isValid( element ) )
+
+    # void
+    def complete( self, element, valid ):
+
+        """
+        Finish the validation with the result of the isValid method. If 
+        the element is not valid it will raise a ValidationError, otherwise
+        it reformats the element's value.
+
+        @param element: Checked object (Field, FieldSet, etc.)
+        @type element: form.Element
+
+        @param valid: Result of the isValid method
+        @type valid: bool
+        """
+
+        if not valid:
             element.getState().setError( self.getMessage( element ) )
             raise ValidationError( element.getState().getError() )
 
         self.reformat( element )
 
+class AsyncValidator( Validator ):
+
+    """
+    Validator for slow checks (database queries, remote services). During
+    the Form.isValidAsync() the isValid method runs in the background and
+    the checks of the different fields are running at the same time, so 
+    the validation takes as long as the slowest check. The normal validate
+    method works without any change.
+    """
+
+    # Executor of the checks, any object with a submit( fn, *args ) method
+    # (eg. concurrent.futures.ThreadPoolExecutor). If it is not defined
+    # every check runs in its own thread.
+    executor = None
+
+    # validators.Task
+    def start( self, element ):
+
+        """
+        Start the isValid method in the background.
+
+        @param element: Checked object (Field, FieldSet, etc.)
+        @type element: form.Element
+
+        @return: Handle of the check (its result() returns the validity)
+        @rtype: validators.Task
+        """
+
+        if self.executor is not None:
+            return self.executor.submit( self.isValid, element )
+
+        return Task( self.isValid, element )
+
 class FieldSetValidator( Validator ):
 
     """
@@ -216,18 +433,22 @@ class FieldSetValidator( Validator ):
         }
 
     # void
-    def validate( self, element ):
+    def complete( self, element, valid ):
 
         """
-        Validate the given element. If an error is occur then it will
-        raise a ValidationError with the final error message. Furthermore
-        it will change the state of the "position" element as well.
+        Finish the validation with the result of the isValid method. If 
+        the element is not valid it will raise a ValidationError with the
+        final error message. Furthermore it will change the state of the 
+        "position" element as well.
 
         @param element: Checked object (Field, FieldSet, etc.)
         @type element: form.Element
+
+        @param valid: Result of the isValid method
+        @type valid: bool
         """
 
-        if not self.isValid( element ):
+        if not valid:
             flashed_element = element \
                 if self.position is None \
                 else element.getField( self.position )
@@ -19,8 +19,112 @@ You should have received a copy of the GNU General Public License
 along with this program. If not, <see http://www.gnu.org/licenses/>.
 """
 
+import os, binascii
+from collections import deque
 from jinja2 import Environment, PackageLoader
 
+# Shared jinja2.Environment objects keyed by the loader's configuration
+_environments = {}
+
+# Macro names of the flat/form.jinja2 template keyed by the widget class
+_flat_macros = {}
+
+# Attributes which are changing the output of a widget, if a subclass
+# overrides one of them the flat macro is not used
+FLAT_OVERRIDES = ( 'default_template', 'getTemplate', 'getData', 'render', 'generate' )
+
+# unicode
+def createMarker():
+
+    """
+    Returns a new random placeholder for the nested renderings. It is
+    created for every rendering, so the submitted values can not contain
+    it and they can not break the placement of the nested outputs.
+
+    @return: Placeholder
+    @rtype: unicode
+    """
+
+    return u'<!--{}-->'.format( binascii.hexlify( os.urandom( 16 ) ).decode( 'ascii' ) )
+
+# bool
+def isFlatRendered( cls ):
+
+    """
+    Check whether the flat macro of the widget class renders the same
+    output as its template: the class which declares the flat_macro has to
+    declare the template and the rendering methods too, so a subclass with
+    eg. its own default_template is rendered by its template.
+
+    @param cls: Widget class
+    @type cls: type
+
+    @return: The flat macro is usable
+    @rtype: bool
+    """
+
+    owner = next( ( c for c in cls.__mro__ if 'flat_macro' in vars( c ) ), None )
+    if owner is None or vars( owner )['flat_macro'] is None:
+        return False
+
+    for name in FLAT_OVERRIDES:
+        declarer = next( c for c in cls.__mro__ if name in vars( c ) )
+        if declarer is not owner and issubclass( declarer, owner ):
+            return False
+
+    return 'default_template' in vars( owner )
+
+# jinja2.Environment
+def getEnvironment( package_name = 'liquid4m', package_path = 'templates' ):
+
+    """
+    Returns the shared Environment of the given template package. The
+    Environment is created once per process, so every Widget is using the
+    same template cache and the templates are compiled only once.
+
+    @param package_name: Name of the package which contains the templates
+    @type package_name: unicode
+
+    @param package_path: Templates directory inside the package
+    @type package_path: unicode
+
+    @return: Shared Environment
+    @rtype: jinja2.Environment
+    """
+
+    key = ( package_name, package_path )
+    if key not in _environments:
+        _environments.setdefault( key, Environment(
+            loader = PackageLoader( package_name, package_path )
+        ) )
+
+    return _environments[ key ]
+
+# void
+def setEnvironment( environment, package_name = 'liquid4m', package_path = 'templates' ):
+
+    """
+    Override the shared Environment of the given template package. Use it
+    to define your own loader, extensions or cache settings for the whole
+    application.
+
+    @param environment: New Environment (None resets the default one)
+    @type environment: jinja2.Environment
+
+    @param package_name: Name of the package which contains the templates
+    @type package_name: unicode
+
+    @param package_path: Templates directory inside the package
+    @type package_path: unicode
+    """
+
+    key = ( package_name, package_path )
+    if environment is None:
+        _environments.pop( key, None )
+        return
+
+    _environments[ key ] = environment
+
 class Widget( object ):
 
     """
@@ -33,18 +137,24 @@ class Widget( object ):
     # Default error widget for error message rendering
     default_error_widget = None
 
+    # Macro of the flat/form.jinja2 template which renders the same output
+    flat_macro = None
+
     # void
     def __init__( self, environment = None, template = None, html = None ):
         
-        self._environment = environment or Environment(
-            loader = PackageLoader('liquid4m')
-        )
+        self._environment = environment
         self._html = html
         self._template = template or self.default_template
         self._error_widget = self.default_error_widget() \
             if self.default_error_widget is not None \
             else None
 
+    # jinja2.Environment
+    def getEnvironment( self ):
+
+        return self._environment or getEnvironment()
+
     # dict
     def getData( self, element ):
 
@@ -55,6 +165,35 @@ class Widget( object ):
 
         return self._template
     
+    # unicode
+    def getMacro( self, element ):
+
+        """
+        Returns the name of the macro which renders the element in the
+        flat/form.jinja2 template. If the widget is using a custom
+        environment, template or HTML, or its class overrides the template
+        or the rendering of the class which declares the macro, it returns
+        None and the element is rendered by the widget.
+
+        @param element: Rendered object
+        @type element: elements.Element
+
+        @return: Name of the macro
+        @rtype: unicode
+        """
+
+        if self._html is not None or self._environment is not None \
+            or self._template != self.default_template:
+            return None
+
+        cls = self.__class__
+        if cls not in _flat_macros:
+            _flat_macros[ cls ] = self.flat_macro \
+                if isFlatRendered( cls ) \
+                else None
+
+        return _flat_macros[ cls ]
+
     # void
     def setErrorWidget( self, error_widget ):
 
@@ -65,17 +204,76 @@ class Widget( object ):
 
         return self._error_widget  
 
+    # jinja2.Template
+    def getTemplateObject( self, element ):
+
+        environment = self.getEnvironment()
+
+        return environment.get_template( self.getTemplate( element ) ) \
+            if self._html is None \
+            else environment.from_string( self._html )
+
     # unicode
     def render( self, element ):
 
-        t = self._environment.get_template( self.getTemplate( element ) ) \
-            if self._html is None \
-            else self._environment.from_string( self._html )
+        data = { 
+            'e': element, 
+            'error_widget': self.getErrorWidget(),
+            'render': lambda child: child.render(),
+            'render_options': lambda child: child.renderOptions()
+        }
+        data.update( self.getData( element ) )
 
-        data = { 'e': element, 'error_widget': self.getErrorWidget() }
+        return self.getTemplateObject( element ).render( data )
+
+    # generator<unicode>
+    def generate( self, element ):
+
+        """
+        Render the element chunk by chunk. The nested elements (and options)
+        are not rendered into the parent's template, they are generated
+        at their place in the stream, so the output could be sent before
+        the last element is rendered.
+
+        @param element: Rendered object
+        @type element: elements.Element
+
+        @return: HTML chunks
+        @rtype: generator<unicode>
+        """
+
+        nested = deque()
+        marker = createMarker()
+
+        # unicode
+        def placeholder( generator ):
+
+            nested.append( generator )
+            return marker
+
+        data = { 
+            'e': element, 
+            'error_widget': self.getErrorWidget(),
+            'render': lambda child: placeholder( child.generate ),
+            'render_options': lambda child: placeholder( child.generateOptions )
+        }
         data.update( self.getData( element ) )
 
-        return t.render( data )
+        for chunk in self.getTemplateObject( element ).generate( data ):
+            if marker not in chunk:
+                yield chunk
+                continue
+
+            parts = chunk.split( marker )
+            if parts[0]:
+                yield parts[0]
+
+            for part in parts[1:]:
+                for nested_chunk in nested.popleft()():
+                    yield nested_chunk
+
+                if part:
+                    yield part
 
 class HTML( Widget ):
 
@@ -87,10 +285,18 @@ class Options( Widget ):
 
     # void
     def __init__( self, element, environment = None, template = None, \
-                  html = None ):
+                  html = None, mark = None ):
         
         super( Options, self ).__init__( environment, template, html )
         self._element = element
+        self._mark = mark or self.mark
+
+    # unicode
+    def mark( self, option, marker ):
+
+        return marker \
+            if self._element.isSelected( option.getValue( self._element ) ) \
+            else u''
 
     # unicode
     def getTemplate( self, element ):
@@ -104,12 +310,14 @@ class Options( Widget ):
 
         return {
             'e': self._element,
-            'options': element
+            'options': element,
+            'mark': self._mark
         }
 
 class FieldSet( Widget ):
 
     default_template = '_error_inline.jinja2'
+    flat_macro = 'fieldset'
 
     # unicode
     def getTemplate( self, element ):
@@ -121,15 +329,21 @@ class FieldSet( Widget ):
 class TooltipError( Widget ):
 
     default_template = 'errors/tooltip.jinja2'
+    flat_macro = 'tooltip_error'
 
 class InlineError( Widget ):
 
     default_template = 'errors/inline.jinja2'
+    flat_macro = 'inline_error'
 
 class Form( Widget ):
 
     default_template = '_form.jinja2'
 
+class FlatForm( Widget ):
+
+    default_template = 'flat/form.jinja2'
+
 class Button( Widget ):
 
     default_template = '_button.jinja2'
@@ -158,6 +372,7 @@ class Button( Widget ):
 class Input( Widget ):
 
     default_template = 'input.jinja2'
+    flat_macro = 'input'
     default_error_widget = TooltipError
 
     # void
@@ -174,24 +389,29 @@ class Input( Widget ):
 class TextArea( Widget ):
 
     default_template = 'textarea.jinja2'
+    flat_macro = 'textarea'
     default_error_widget = TooltipError
 
 class Select( Widget ):
 
     default_template = 'select.jinja2'
+    flat_macro = 'select'
     default_error_widget = TooltipError
 
 class Checkbox( Widget ):
 
     default_template = 'checkbox.jinja2'
+    flat_macro = 'checkbox'
     default_error_widget = InlineError
 
 class Radio( Widget ):
 
     default_template = 'radio.jinja2'
+    flat_macro = 'radio'
     default_error_widget = InlineError
 
 class Autocomplete( Widget ):
 
     default_template = 'autocomplete.jinja2'
+    flat_macro = 'autocomplete'
     default_error_widget = InlineError